@@ -0,0 +1,195 @@
+"""
+Extraction benchmark against the pre-shared-document baseline.
+
+Runs simple_scraper._extract_page (all four extract types) over each page
+in two code trees: the current one, and the backend as of the baseline,
+by default the parent of the commit that added
+scraper_engine/document.py, i.e. before pages were parsed once into a
+shared document (BeautifulSoup per stage). The baseline tree is exported
+with `git archive` and run in a separate process, so both sides are the
+real code paths. Reports HTML parses (all four extract types) and CPU
+ms per page, and any output that differs. Parses trafilatura makes
+internally (its readability fallback re-parses the page) count on both
+sides.
+
+Usage (from backend/):
+    python benchmarks/bench_extraction.py                      # bundled fixtures
+    python benchmarks/bench_extraction.py page1.html ...       # your own pages
+    python benchmarks/bench_extraction.py --against REF ...    # explicit baseline
+
+Pass --against where the history does not reach the baseline (shallow
+clones). Exits non-zero if any extraction output differs from the baseline.
+"""
+
+import functools
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+REPO = os.path.dirname(BACKEND)
+# The baseline is the tree just before this file was added
+SHARED_DOCUMENT_PATH = "backend/scraper_engine/document.py"
+EXTRACT_TYPES = ("auto", "article", "text", "structured")
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "*.html")
+ROUNDS = 3
+URL = "https://example.com/benchmark"
+
+
+def _count_parses() -> dict:
+    """
+    Count HTML parses from here on.
+
+    Wraps the lxml and BeautifulSoup entry points; a parse that goes
+    through several of them (lxml.html.fromstring calls
+    document_fromstring, ...) counts once. Must run before the code
+    under test is imported, so `from lxml.html import fromstring` binds
+    the wrapper.
+
+    Returns:
+        Counter dict; read and reset its "parses" entry
+    """
+    import bs4
+    import lxml.etree
+    import lxml.html
+
+    counter = {"parses": 0, "depth": 0}
+
+    def counting(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if counter["depth"] == 0:
+                counter["parses"] += 1
+            counter["depth"] += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                counter["depth"] -= 1
+
+        return wrapper
+
+    for module, name in (
+        (lxml.html, "fromstring"),
+        (lxml.html, "document_fromstring"),
+        (lxml.html, "fragment_fromstring"),
+        (lxml.html, "fragments_fromstring"),
+        (lxml.etree, "fromstring"),
+        (lxml.etree, "HTML"),
+    ):
+        setattr(module, name, counting(getattr(module, name)))
+    bs4.BeautifulSoup.__init__ = counting(bs4.BeautifulSoup.__init__)
+    return counter
+
+
+def _worker(backend: str, paths: list[str]) -> None:
+    """Run in a subprocess: time _extract_page in `backend`, print JSON results."""
+    counter = _count_parses()
+    sys.path.insert(0, backend)
+    from scraper_engine.simple_scraper import _extract_page
+
+    results = {}
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            html = f.read()
+        outputs = {}
+        counter["parses"] = 0
+        started = time.process_time()
+        for _ in range(ROUNDS):
+            for extract_type in EXTRACT_TYPES:
+                outputs[extract_type] = _extract_page(html, URL, extract_type)
+        elapsed = time.process_time() - started
+        for output in outputs.values():
+            # Added after the baseline; not part of the comparison.
+            output.pop("js_signals", None)
+        results[path] = {
+            "cpu_ms": elapsed / ROUNDS * 1000,
+            "parses": counter["parses"] / ROUNDS,
+            "outputs": outputs,
+        }
+    json.dump(results, sys.stdout, default=str)
+
+
+def _run(backend: str, paths: list[str]) -> dict:
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", backend, *paths],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=backend,
+    )
+    return json.loads(completed.stdout)
+
+
+def _default_baseline() -> str:
+    """Parent of the commit that added the shared document module."""
+    added = subprocess.run(
+        ["git", "log", "--diff-filter=A", "--format=%H", "--", SHARED_DOCUMENT_PATH],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=REPO,
+    ).stdout.split()
+    if not added:
+        raise SystemExit(f"Cannot find the commit that added {SHARED_DOCUMENT_PATH}; pass --against REF")
+    return f"{added[-1]}~1"
+
+
+def _export_baseline(ref: str, target: str) -> str:
+    """Extract the backend directory as of `ref` into `target`."""
+    archive = subprocess.run(["git", "archive", f"{ref}:backend"], check=True, capture_output=True, cwd=REPO).stdout
+    subprocess.run(["tar", "-x", "-C", target], input=archive, check=True)
+    return target
+
+
+def main(args: list[str]) -> int:
+    ref = None
+    if args[:1] == ["--against"]:
+        ref, args = args[1], args[2:]
+    ref = ref or _default_baseline()
+    paths = [os.path.abspath(path) for path in args] or sorted(glob.glob(FIXTURES))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = _run(_export_baseline(ref, tmp), paths)
+    current = _run(BACKEND, paths)
+
+    mismatches = 0
+    total_before = total_after = 0.0
+    parses_before = parses_after = 0.0
+    print(f"Baseline: {ref}")
+    print(f"{'page':<36} {'parses':>14} {'baseline ms':>12} {'current ms':>11} {'speedup':>8}")
+    for path in paths:
+        before, after = baseline[path], current[path]
+        total_before += before["cpu_ms"]
+        total_after += after["cpu_ms"]
+        parses_before += before["parses"]
+        parses_after += after["parses"]
+        print(
+            f"{os.path.basename(path)[:36]:<36} {before['parses']:>6.0f} -> {after['parses']:<5.0f} "
+            f"{before['cpu_ms']:>12.1f} {after['cpu_ms']:>11.1f} {before['cpu_ms'] / after['cpu_ms']:>7.2f}x"
+        )
+        for extract_type in EXTRACT_TYPES:
+            expected, actual = before["outputs"][extract_type], after["outputs"][extract_type]
+            for key in sorted(set(expected) | set(actual)):
+                if expected.get(key) != actual.get(key):
+                    mismatches += 1
+                    print(f"  MISMATCH [{extract_type}] {key}:")
+                    print(f"    baseline: {expected.get(key)!r:.300}")
+                    print(f"    current:  {actual.get(key)!r:.300}")
+
+    print(
+        f"{'total':<36} {parses_before:>6.0f} -> {parses_after:<5.0f} "
+        f"{total_before:>12.1f} {total_after:>11.1f} {total_before / total_after:>7.2f}x"
+    )
+    print("OK: output matches the baseline" if not mismatches else f"FAILED: {mismatches} mismatch(es)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--worker"]:
+        _worker(sys.argv[2], sys.argv[3:])
+    else:
+        sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,91 @@
+"""
+List endpoint read-path benchmark.
+
+Times the work behind /items?limit=1000 against the configured database,
+three ways:
+
+- orm:   full ScrapedItem objects, then ScrapedItemOut validation per row
+         (the read path before column projection)
+- lean:  crud.get_items column projection serialized with crud.item_row_json
+- lean, no summary: the same with include_summary=False
+
+Each round runs the query, builds the JSON body and encodes it, like the
+endpoint does. Reports rows/sec.
+
+No reference numbers are recorded for this change: it was written
+without a Postgres database to run against, so whether the lean path
+is faster, and by how much, is for this script to show on real data.
+
+Usage (from backend/):
+    python benchmarks/bench_items.py            # limit=1000
+    python benchmarks/bench_items.py 200        # another page size
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import select  # noqa: E402
+
+import crud  # noqa: E402
+import schemas  # noqa: E402
+from db import close_async_engine, get_async_sessionmaker  # noqa: E402
+from models import ScrapedItem  # noqa: E402
+
+ROUNDS = 20
+
+
+async def _orm_body(db, limit: int) -> str:
+    stmt = select(ScrapedItem).order_by(*crud.KEYSET_ORDER).limit(limit)
+    items = (await db.execute(stmt)).scalars().all()
+    return json.dumps([schemas.ScrapedItemOut.model_validate(item).model_dump(mode="json") for item in items])
+
+
+async def _lean_body(db, limit: int, include_summary: bool = True) -> str:
+    rows = await crud.get_items(db, limit=limit, include_summary=include_summary)
+    return json.dumps([crud.item_row_json(row) for row in rows])
+
+
+async def _rows_per_second(build, limit: int, **kwargs) -> tuple[float, int]:
+    session_factory = get_async_sessionmaker()
+    rows = 0
+    elapsed = 0.0
+    for _ in range(ROUNDS):
+        # A fresh session per round, like one API request.
+        async with session_factory() as db:
+            started = time.perf_counter()
+            body = await build(db, limit, **kwargs)
+            elapsed += time.perf_counter() - started
+        rows += len(json.loads(body))
+    return rows / elapsed if elapsed else 0.0, rows // ROUNDS
+
+
+async def main(args: list[str]) -> int:
+    limit = int(args[0]) if args else 1000
+    try:
+        # Warm the pool and Postgres' caches before timing.
+        async with get_async_sessionmaker()() as db:
+            await _lean_body(db, limit)
+
+        variants = [
+            ("orm + pydantic", _orm_body, {}),
+            ("lean rows", _lean_body, {}),
+            ("lean rows, no summary", _lean_body, {"include_summary": False}),
+        ]
+        baseline = None
+        print(f"{'read path':<24} {'rows/page':>10} {'rows/sec':>12} {'speedup':>8}")
+        for name, build, kwargs in variants:
+            rate, page_rows = await _rows_per_second(build, limit, **kwargs)
+            baseline = baseline or rate
+            print(f"{name:<24} {page_rows:>10} {rate:>12,.0f} {rate / baseline:>7.2f}x")
+    finally:
+        await close_async_engine()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,92 @@
+"""
+Parser backend parity check.
+
+Runs simple_scraper's metadata, tag, table, list and fallback helpers
+with every HTML parser backend over a fixture corpus, reports any output
+that differs between backends, and compares per-page CPU time.
+
+Usage (from backend/):
+    python benchmarks/check_parser_backends.py                 # bundled fixtures
+    python benchmarks/check_parser_backends.py page1.html ...  # your own pages
+
+Exits non-zero if any backend disagrees with the reference 'bs4' backend.
+"""
+
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scraper_engine.document import ParsedDocument  # noqa: E402
+from scraper_engine.parsers import _BACKENDS, get_parser_backend  # noqa: E402
+from scraper_engine.simple_scraper import (  # noqa: E402
+    _NOISE_TAGS,
+    _build_semantic_fallback,
+    _extract_lists,
+    _extract_meta_content,
+    _extract_tables,
+    _extract_tags,
+)
+
+ROUNDS = 5
+REFERENCE = "bs4"
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "*.html")
+
+
+def _run_helpers(html: str, backend: str, strip_noise: bool) -> dict:
+    doc = ParsedDocument(html)
+    if strip_noise:
+        doc.strip_tags(_NOISE_TAGS)
+    parser = get_parser_backend(doc, backend)
+    return {
+        "meta": [
+            _extract_meta_content(parser, [{"name": name}])
+            for name in ("description", "author", "keywords", "date")
+        ],
+        "title": parser.title(),
+        "heading": parser.heading(),
+        "tags": _extract_tags(parser),
+        "tables": _extract_tables(parser),
+        "lists": _extract_lists(parser),
+        "fallback": _build_semantic_fallback(parser),
+    }
+
+
+def _cpu_ms(html: str, backend: str) -> float:
+    started = time.process_time()
+    for _ in range(ROUNDS):
+        _run_helpers(html, backend, strip_noise=False)
+    return (time.process_time() - started) / ROUNDS * 1000
+
+
+def main(paths: list[str]) -> int:
+    paths = paths or sorted(glob.glob(FIXTURES))
+    mismatches = 0
+
+    print(f"{'page':<32} " + " ".join(f"{name + ' ms':>10}" for name in _BACKENDS))
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            html = f.read()
+
+        for strip_noise in (False, True):
+            expected = _run_helpers(html, REFERENCE, strip_noise)
+            for backend in _BACKENDS:
+                actual = _run_helpers(html, backend, strip_noise)
+                for key in expected:
+                    if actual[key] != expected[key]:
+                        mismatches += 1
+                        print(f"MISMATCH {os.path.basename(path)} [{backend}, strip={strip_noise}] {key}:")
+                        print(f"  {REFERENCE}: {expected[key]!r:.300}")
+                        print(f"  {backend}: {actual[key]!r:.300}")
+
+        timings = " ".join(f"{_cpu_ms(html, name):>10.1f}" for name in _BACKENDS)
+        print(f"{os.path.basename(path)[:32]:<32} {timings}")
+
+    print("OK: all backends agree" if not mismatches else f"FAILED: {mismatches} mismatch(es)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
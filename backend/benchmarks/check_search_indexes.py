@@ -0,0 +1,76 @@
+"""
+Search index check.
+
+EXPLAINs the full-text and fuzzy search queries against the configured
+database and verifies each plan reads every index it was written for:
+
+- full-text search   -> GIN index on search_vector (migration 004)
+- fuzzy filter       -> GIN trigram indexes on title/summary (migration 001)
+
+Sequential scans are disabled for the EXPLAIN so the check also holds on
+small tables, where the planner would otherwise prefer a seq scan; a
+query whose predicate cannot use an index still plans as a seq scan.
+
+Usage (from backend/):
+    python benchmarks/check_search_indexes.py [query]
+
+Exits non-zero if a plan does not use its expected index.
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import crud  # noqa: E402
+from db import engine  # noqa: E402
+
+
+def _checks(q: str):
+    full_text, _ = crud.full_text_search_stmt(q)
+    return [
+        ("full-text search", full_text.limit(50), {"ix_scraped_items_search_vector"}),
+        (
+            "fuzzy filter",
+            crud.fuzzy_search_stmt(q).limit(50),
+            {"idx_scraped_items_title_trgm", "idx_scraped_items_summary_trgm"},
+        ),
+    ]
+
+
+def _plan_nodes(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _explain(conn, stmt) -> dict:
+    compiled = stmt.compile(bind=conn)
+    result = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+    plan = result.scalar()
+    return (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+
+
+def main(args: list[str]) -> int:
+    q = args[0] if args else "pyhton"
+    failures = 0
+
+    # Settings are transaction-local and discarded when the connection closes.
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        conn.execute(crud.fuzzy_thresholds_stmt())
+        for name, stmt, expected in _checks(q):
+            nodes = list(_plan_nodes(_explain(conn, stmt)))
+            used = {node["Index Name"] for node in nodes if "Index Name" in node}
+            ok = expected <= used
+            failures += not ok
+            shape = " > ".join(node["Node Type"] for node in nodes)
+            print(f"{'OK  ' if ok else 'FAIL'} {name:<18} indexes={sorted(used) or '-'}  plan: {shape}")
+
+    print("OK: all search queries use their indexes" if not failures else f"FAILED: {failures} check(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,69 +1,255 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import select, or_, func
-from models import ScrapedItem
+import base64
+import json
+import os
+from datetime import datetime
+from typing import Optional, Sequence
 
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, or_, func, tuple_, literal, Float, Text
+from models import ScrapedItem, TEXT_SEARCH_CONFIG
 
-def get_items(db: Session, skip: int = 0, limit: int = 50, tag: str = None):
-    """Get items with optional tag filtering."""
-    stmt = select(ScrapedItem)
+# Deepest offset accepted; past this, clients must page with a cursor
+MAX_OFFSET = int(os.getenv("MAX_OFFSET", "1000"))
+
+# Newest first; (scraped_at, id) is unique, so the order is stable for keyset paging
+KEYSET_ORDER = (ScrapedItem.scraped_at.desc(), ScrapedItem.id.desc())
+
+# What list endpoints return; crawler bookkeeping columns are left out
+ITEM_LIST_COLUMNS = (
+    ScrapedItem.id,
+    ScrapedItem.source,
+    ScrapedItem.title,
+    ScrapedItem.url,
+    ScrapedItem.summary,
+    ScrapedItem.tags,
+    ScrapedItem.published_at,
+    ScrapedItem.scraped_at,
+)
+
+# pg_trgm thresholds for fuzzy search: whole-title similarity, and best
+# match of the query against any part of the summary
+FUZZY_SIMILARITY_THRESHOLD = float(os.getenv("FUZZY_SIMILARITY_THRESHOLD", "0.3"))
+FUZZY_WORD_SIMILARITY_THRESHOLD = float(os.getenv("FUZZY_WORD_SIMILARITY_THRESHOLD", "0.6"))
+
+# Highlighted snippets: up to two fragments of the summary (or title)
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=30, MinWords=10"
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def _encode_cursor(values: list) -> str:
+    raw = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, *types):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if len(values) != len(types):
+            raise ValueError("wrong number of cursor fields")
+        return tuple(convert(value) for convert, value in zip(types, values))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+
+
+def encode_cursor(item) -> str:
+    """Opaque cursor pointing just past the given item (model instance or row)."""
+    return _encode_cursor([item.scraped_at.isoformat(), item.id])
+
+
+def decode_cursor(cursor: str):
+    """
+    Decode a cursor from encode_cursor.
+
+    Returns:
+        (scraped_at, id) tuple
+
+    Raises:
+        InvalidCursor: If the cursor is malformed
+    """
+    return _decode_cursor(cursor, datetime.fromisoformat, int)
+
+
+def next_cursor(items: Sequence, limit: int) -> Optional[str]:
+    """Cursor for the page after items, or None if this was the last page."""
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor(items[-1])
+
+
+def next_search_cursor(rows: Sequence, limit: int) -> Optional[str]:
+    """Cursor for the page after search_items rows, or None if this was the last page."""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return _encode_cursor([last.rank, last.ScrapedItem.id])
+
+
+def _paginate(stmt, skip: int, limit: int, cursor: Optional[str]):
+    """Order by (scraped_at, id) and apply a cursor (keyset) or a shallow offset."""
+    stmt = stmt.order_by(*KEYSET_ORDER)
+    if cursor:
+        # Row-value comparison matches the composite index, so any page costs the same.
+        stmt = stmt.where(tuple_(ScrapedItem.scraped_at, ScrapedItem.id) < decode_cursor(cursor))
+    elif skip:
+        stmt = stmt.offset(skip)
+    return stmt.limit(limit)
+
+
+def item_columns(include_summary: bool = True):
+    """Columns returned for list views, in ScrapedItemOut order."""
+    return [column for column in ITEM_LIST_COLUMNS if include_summary or column is not ScrapedItem.summary]
+
+
+async def get_items(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 50,
+    tag: str = None,
+    cursor: str = None,
+    include_summary: bool = True,
+):
+    """
+    Get items, newest first, with optional tag filtering and cursor paging.
+
+    Selects only the list columns and returns plain rows (no ORM
+    instances, identity map or change tracking). Rows support attribute
+    access like the model, e.g. row.title.
+
+    Returns:
+        Rows of the item_columns() columns
+    """
+    stmt = select(*item_columns(include_summary))
     
     if tag:
         # Filter by tag using PostgreSQL JSONB contains operator
         stmt = stmt.where(ScrapedItem.tags.contains([tag]))
     
-    stmt = stmt.offset(skip).limit(limit)
-    return db.execute(stmt).scalars().all()
+    stmt = _paginate(stmt, skip, limit, cursor)
+    return (await db.execute(stmt)).all()
 
 
-def search_items(db: Session, q: str, skip: int = 0, limit: int = 50, tag: str = None):
+def item_row_json(row) -> dict:
     """
-    Search items by query string with optional tag filtering.
-    Searches in both title and summary fields.
+    JSON-ready dict for a projected item row, without pydantic validation.
+
+    Args:
+        row: Row from get_items
+
+    Returns:
+        Dictionary matching ScrapedItemListOut's JSON output
     """
-    stmt = select(ScrapedItem)
-    
-    # Search in title and summary
-    search_filter = or_(
-        ScrapedItem.title.ilike(f"%{q}%"),
-        ScrapedItem.summary.ilike(f"%{q}%")
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in row._mapping.items()
+    }
+
+
+def full_text_search_stmt(q: str, tag: str = None, highlight: bool = False):
+    """
+    Statement behind search_items, ordered by rank (also used by the index check).
+
+    Returns:
+        (statement, rank expression) tuple
+    """
+    query = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, q)
+    rank = func.ts_rank(ScrapedItem.search_vector, query)
+    if highlight:
+        # Expensive, but Postgres defers it past ORDER BY/LIMIT to the returned rows only.
+        snippet = func.ts_headline(
+            TEXT_SEARCH_CONFIG,
+            func.coalesce(ScrapedItem.summary, ScrapedItem.title),
+            query,
+            HEADLINE_OPTIONS,
+        )
+    else:
+        snippet = literal(None, type_=Text)
+
+    stmt = select(ScrapedItem, rank.label("rank"), snippet.label("snippet")).where(
+        ScrapedItem.search_vector.op("@@")(query)
     )
-    stmt = stmt.where(search_filter)
     
     # Add tag filter if provided
     if tag:
         stmt = stmt.where(ScrapedItem.tags.contains([tag]))
     
-    stmt = stmt.offset(skip).limit(limit)
-    return db.execute(stmt).scalars().all()
+    return stmt.order_by(rank.desc(), ScrapedItem.id.desc()), rank
 
 
-def search_items_fuzzy(db: Session, q: str, skip: int = 0, limit: int = 50, tag: str = None):
+async def search_items(
+    db: AsyncSession,
+    q: str,
+    skip: int = 0,
+    limit: int = 50,
+    tag: str = None,
+    cursor: str = None,
+    highlight: bool = False,
+):
     """
-    Fuzzy search using PostgreSQL trigram similarity.
-    Requires pg_trgm extension to be enabled in PostgreSQL.
+    Full-text search over title, summary and tags with optional tag filtering.
+
+    Uses the GIN-indexed search_vector column with websearch_to_tsquery
+    syntax ("quoted phrases", OR, -exclusions) and orders by ts_rank.
+
+    Returns:
+        Rows of (ScrapedItem, rank, snippet); snippet is None unless
+        highlight is set
     """
-    stmt = select(ScrapedItem)
-    
-    # Use trigram similarity for fuzzy matching
-    # similarity threshold of 0.3 (30% similar)
-    similarity_threshold = 0.3
-    search_filter = or_(
-        func.similarity(ScrapedItem.title, q) > similarity_threshold,
-        func.similarity(ScrapedItem.summary, q) > similarity_threshold
+    stmt, rank = full_text_search_stmt(q, tag, highlight)
+    if cursor:
+        stmt = stmt.where(tuple_(rank, ScrapedItem.id) < _decode_cursor(cursor, float, int))
+    elif skip:
+        stmt = stmt.offset(skip)
+    return (await db.execute(stmt.limit(limit))).all()
+
+
+def fuzzy_search_stmt(q: str, tag: str = None):
+    """
+    Statement behind search_items_fuzzy (also used by the index check).
+
+    Filters with the trigram operators rather than similarity() calls so
+    the GIN trigram indexes apply: `title % q` and `summary %> q` (q
+    word-similar to part of the summary). Orders by the better of the
+    two matching distances, `least(title <-> q, q <<-> summary)`, so an
+    item matched on its summary ranks by that match rather than by an
+    unrelated title.
+    """
+    distance = func.least(
+        ScrapedItem.title.op("<->", return_type=Float)(q),
+        literal(q, type_=Text).op("<<->", return_type=Float)(ScrapedItem.summary),
+        type_=Float,
     )
-    stmt = stmt.where(search_filter)
+    stmt = select(ScrapedItem, (1.0 - distance).label("rank"), literal(None, type_=Text).label("snippet"))
+    stmt = stmt.where(or_(ScrapedItem.title.op("%")(q), ScrapedItem.summary.op("%>")(q)))
     
     # Add tag filter if provided
     if tag:
         stmt = stmt.where(ScrapedItem.tags.contains([tag]))
     
-    # Order by similarity (most similar first)
-    stmt = stmt.order_by(
-        func.greatest(
-            func.similarity(ScrapedItem.title, q),
-            func.similarity(ScrapedItem.summary, q)
-        ).desc()
+    return stmt.order_by(distance, ScrapedItem.id)
+
+
+def fuzzy_thresholds_stmt():
+    """Statement applying the pg_trgm thresholds the % and %> operators use, for this transaction."""
+    return select(
+        func.set_config("pg_trgm.similarity_threshold", str(FUZZY_SIMILARITY_THRESHOLD), True),
+        func.set_config("pg_trgm.word_similarity_threshold", str(FUZZY_WORD_SIMILARITY_THRESHOLD), True),
     )
-    
-    stmt = stmt.offset(skip).limit(limit)
-    return db.execute(stmt).scalars().all()
\ No newline at end of file
+
+
+async def search_items_fuzzy(db: AsyncSession, q: str, skip: int = 0, limit: int = 50, tag: str = None):
+    """
+    Fuzzy search using PostgreSQL trigram similarity.
+    Requires pg_trgm extension to be enabled in PostgreSQL.
+
+    Returns:
+        Rows of (ScrapedItem, rank, snippet) like search_items; rank is
+        the better of the title similarity and the summary word
+        similarity, and snippet is always None
+    """
+    await db.execute(fuzzy_thresholds_stmt())
+    stmt = fuzzy_search_stmt(q, tag).offset(skip).limit(limit)
+    return (await db.execute(stmt)).all()
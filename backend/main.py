@@ -7,19 +7,22 @@ import sys
 if platform.system() == 'Windows':
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
 
-from fastapi import FastAPI, Depends, Query, HTTPException
+from fastapi import FastAPI, Depends, Query, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, StreamingResponse
-from sqlalchemy.orm import Session
-from db import SessionLocal, engine
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from db import close_async_engine, engine, get_async_sessionmaker
 from models import Base
 import crud
 import schemas
-from scheduler import start_scheduler, stop_scheduler, run_spiders_async, DEFAULT_SPIDERS
+from scheduler import start_scheduler, stop_scheduler, get_schedules, DEFAULT_SPIDERS
+from spider_jobs import get_spider_job, list_spider_jobs, shutdown_spider_jobs, submit_spider_job
 from pdf_export import generate_items_pdf, generate_simple_table_pdf
 import io
 import csv
 import logging
+from datetime import datetime
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -45,15 +48,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with get_async_sessionmaker()() as db:
         yield db
-    finally:
-        db.close()
 
 
 @app.on_event("startup")
@@ -70,16 +71,77 @@ def on_startup():
     except Exception as e:
         print(f"⚠ Scheduler error: {e}")
 
+    try:
+        from scraper_engine.http_client import get_http_client
+        get_http_client()
+        print("✓ HTTP client pool ready")
+    except Exception as e:
+        print(f"⚠ HTTP client setup error: {e}")
+
+    try:
+        from scraper_engine.extraction_pool import get_extraction_executor
+        get_extraction_executor()
+        print("✓ Extraction pool ready")
+    except Exception as e:
+        print(f"⚠ Extraction pool setup error: {e}")
+
+
+@app.on_event("startup")
+async def warm_browser_pool():
+    """Pre-warm browser contexts so the first JS-rendered scrape is not a cold start."""
+    try:
+        from scraper_engine.browser_pool import BROWSER_POOL_WARM, get_browser_pool
+        if BROWSER_POOL_WARM > 0:
+            await get_browser_pool().warm(BROWSER_POOL_WARM)
+            print(f"✓ Browser pool warmed ({BROWSER_POOL_WARM} contexts)")
+    except ImportError:
+        print("⚠ Browser pool skipped (Playwright unavailable in this environment)")
+    except Exception as e:
+        print(f"⚠ Browser pool warm-up error: {e}")
+
 
 @app.on_event("shutdown")
 async def on_shutdown():
     """Cleanup on server shutdown."""
 
+    try:
+        await close_async_engine()
+        logger.info("Database pool closed")
+    except Exception as e:
+        logger.error(f"Database pool shutdown error: {e}")
+
     try:
         stop_scheduler()
         logger.info("Scheduler stopped")
     except Exception as e:
         logger.error(f"Scheduler shutdown error: {e}")
+
+    try:
+        shutdown_spider_jobs()
+    except Exception as e:
+        logger.error(f"Spider job queue shutdown error: {e}")
+
+    try:
+        from scraper_engine.http_client import close_http_client
+        from scraper_engine.rate_limiter import reset_rate_limiter
+        await close_http_client()
+        reset_rate_limiter()
+        logger.info("HTTP client closed")
+    except Exception as e:
+        logger.error(f"HTTP client shutdown error: {e}")
+
+    try:
+        from scraper_engine.extraction_pool import shutdown_extraction_executor
+        shutdown_extraction_executor()
+        logger.info("Extraction pool stopped")
+    except Exception as e:
+        logger.error(f"Extraction pool shutdown error: {e}")
+
+    try:
+        from scraper_engine.response_cache import close_response_cache
+        close_response_cache()
+    except Exception as e:
+        logger.error(f"Response cache shutdown error: {e}")
     
     try:
         from scraper_engine.browser_pool import close_browser
@@ -101,59 +163,135 @@ def health():
     return {"status": "healthy"}
 
 
-@app.get("/items", response_model=list[schemas.ScrapedItemOut])
-def list_items(
+@app.get("/scrape/stats")
+async def scrape_stats():
+    """Runtime counters of the scraping engine."""
+    # async so it runs on the event loop, which owns these structures;
+    # read from a threadpool thread they could change size mid-iteration.
+    from scraper_engine.extraction_cache import get_extraction_cache
+    from scraper_engine.hybrid import engine_stats
+    from scraper_engine.rate_limiter import get_rate_limiter
+
+    cache = get_extraction_cache()
+    try:
+        from scraper_engine.browser_pool import get_browser_pool
+        browser_pool = get_browser_pool().stats()
+    except ImportError:
+        browser_pool = None
+    return {
+        "extraction_cache": cache.stats() if cache else None,
+        "hosts": get_rate_limiter().stats(),
+        "browser_pool": browser_pool,
+        "hybrid_hosts": engine_stats(),
+    }
+
+
+def _check_paging(skip: int, cursor: str):
+    """Reject deep offsets and mixing offset with a cursor."""
+    if cursor and skip:
+        raise HTTPException(status_code=400, detail="Use either skip or cursor, not both")
+    if skip > crud.MAX_OFFSET:
+        raise HTTPException(
+            status_code=400,
+            detail=f"skip is limited to {crud.MAX_OFFSET}; page deeper with the X-Next-Cursor cursor",
+        )
+
+
+@app.get("/items", response_model=list[schemas.ScrapedItemListOut])
+async def list_items(
     skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=50, le=1000),
+    limit: int = Query(default=50, ge=1, le=1000),
     tag: str = Query(default=None, description="Filter by tag (e.g., 'news', 'tech')"),
-    db: Session = Depends(get_db),
+    cursor: str = Query(default=None, description="X-Next-Cursor value from the previous page"),
+    include_summary: bool = Query(default=True, description="Include each item's summary"),
+    db: AsyncSession = Depends(get_db),
 ):
     """
-    List items with optional tag filtering.
+    List items, newest first, with optional tag filtering.
+
+    When more items may follow, the X-Next-Cursor response header holds
+    the cursor for the next page. Rows are serialized straight from the
+    projected columns (no ORM objects or per-row validation).
     
     Examples:
     - /items - Get all items
     - /items?tag=news - Get only news items
     - /items?tag=tech&limit=10 - Get 10 tech items
+    - /items?cursor=<X-Next-Cursor> - Get the next page
+    - /items?include_summary=false - Leaner rows for list views
     """
-    return crud.get_items(db, skip=skip, limit=limit, tag=tag)
+    _check_paging(skip, cursor)
+    try:
+        rows = await crud.get_items(
+            db, skip=skip, limit=limit, tag=tag, cursor=cursor, include_summary=include_summary
+        )
+    except crud.InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
+    next_cursor = crud.next_cursor(rows, limit)
+    return JSONResponse(
+        content=[crud.item_row_json(row) for row in rows],
+        headers={"X-Next-Cursor": next_cursor} if next_cursor else None,
+    )
 
-@app.get("/search", response_model=list[schemas.ScrapedItemOut])
-def search_items(
+
+@app.get("/search", response_model=list[schemas.SearchResultOut])
+async def search_items(
+    response: Response,
     q: str = Query(..., description="Search query"),
-    skip: int = 0,
-    limit: int = Query(50, le=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
     tag: str = Query(None, description="Filter by tag"),
     fuzzy: bool = Query(False, description="Enable fuzzy search (requires pg_trgm extension)"),
-    db: Session = Depends(get_db),
+    highlight: bool = Query(False, description="Include a highlighted snippet per result"),
+    cursor: str = Query(None, description="X-Next-Cursor value from the previous page (not for fuzzy search)"),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Search items by query with optional tag filtering.
+
+    Full-text search accepts web search syntax ("quoted phrase", OR,
+    -exclude), is ordered by relevance and pages with X-Next-Cursor like
+    /items. Fuzzy search is ordered by similarity and pages with skip only.
     
     Examples:
-    - /search?q=python - Search for 'python' in title and summary
+    - /search?q=python - Search for 'python' in title, summary and tags
     - /search?q=ai&tag=tech - Search for 'ai' in tech items
+    - /search?q="machine learning" -crypto&highlight=true - Phrase search with snippets
     - /search?q=machine&fuzzy=true - Fuzzy search for 'machine'
     """
+    _check_paging(skip, cursor)
     if fuzzy:
-        return crud.search_items_fuzzy(db, q=q, skip=skip, limit=limit, tag=tag)
+        if cursor:
+            raise HTTPException(status_code=400, detail="Fuzzy search does not support cursor paging")
+        rows = await crud.search_items_fuzzy(db, q=q, skip=skip, limit=limit, tag=tag)
     else:
-        return crud.search_items(db, q=q, skip=skip, limit=limit, tag=tag)
+        try:
+            rows = await crud.search_items(db, q=q, skip=skip, limit=limit, tag=tag, cursor=cursor, highlight=highlight)
+        except crud.InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        cursor = crud.next_search_cursor(rows, limit)
+        if cursor:
+            response.headers["X-Next-Cursor"] = cursor
+    return [
+        schemas.SearchResultOut.model_validate(row.ScrapedItem).model_copy(
+            update={"rank": row.rank, "snippet": row.snippet}
+        )
+        for row in rows
+    ]
 
 
 @app.get("/items/export")
-def export_items_json(db: Session = Depends(get_db)):
+async def export_items_json(db: AsyncSession = Depends(get_db)):
     """Export items as JSON."""
-    items = crud.get_items(db, skip=0, limit=1000)
-    data = [schemas.ScrapedItemOut.model_validate(i).model_dump(mode="json") for i in items]
-    return JSONResponse(content=data)
+    rows = await crud.get_items(db, skip=0, limit=1000)
+    return JSONResponse(content=[crud.item_row_json(row) for row in rows])
 
 
 @app.get("/items/export/csv")
-def export_items_csv(db: Session = Depends(get_db)):
+async def export_items_csv(db: AsyncSession = Depends(get_db)):
     """Export items as CSV."""
-    items = crud.get_items(db, skip=0, limit=1000)
+    items = await crud.get_items(db, skip=0, limit=1000)
 
     output = io.StringIO()
     writer = csv.writer(output)
@@ -173,11 +311,11 @@ def export_items_csv(db: Session = Depends(get_db)):
 
 
 @app.get("/items/export/pdf")
-def export_items_pdf(
+async def export_items_pdf(
     style: str = Query("detailed", description="PDF style: 'detailed' or 'simple'"),
     limit: int = Query(100, le=500, description="Maximum number of items to export"),
     tag: str = Query(None, description="Filter by tag"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Export items as PDF.
@@ -192,15 +330,16 @@ def export_items_pdf(
     - /items/export/pdf?style=simple - Export in simple table format
     - /items/export/pdf?tag=news&limit=50 - Export 50 news items
     """
-    items = crud.get_items(db, skip=0, limit=limit, tag=tag)
+    items = await crud.get_items(db, skip=0, limit=limit, tag=tag)
     
     if not items:
         raise HTTPException(status_code=404, detail="No items found to export")
     
+    # Rendering is CPU-bound; keep it off the event loop.
     if style == "simple":
-        pdf_buffer = generate_simple_table_pdf(items)
+        pdf_buffer = await run_in_threadpool(generate_simple_table_pdf, items)
     else:
-        pdf_buffer = generate_items_pdf(items)
+        pdf_buffer = await run_in_threadpool(generate_items_pdf, items)
     
     return StreamingResponse(
         pdf_buffer,
@@ -209,12 +348,17 @@ def export_items_pdf(
     )
 
 
-@app.post("/scrape/run")
-async def run_scrape(
+@app.post("/scrape/run", status_code=202)
+def run_scrape(
     spiders: list[str] = Query(default=None, description="List of spider names")
 ):
     """
     Manually trigger scraping for specified spiders.
+
+    Queues a crawl job and returns its ID immediately; poll
+    GET /scrape/jobs/{job_id} for status and stats. Spiders already
+    queued or running are not started again; they are reported under
+    `coalesced` with the ID of the job they belong to.
     
     Examples:
     - POST /scrape/run?spiders=news&spiders=jobs
@@ -226,8 +370,59 @@ async def run_scrape(
     if not spiders:
         raise HTTPException(status_code=400, detail="No spiders specified")
 
-    await run_spiders_async(spiders)
-    return {"status": "ok", "spiders": spiders, "message": f"Successfully triggered {len(spiders)} spider(s)"}
+    submission = submit_spider_job(spiders)
+    job = submission.job
+    return {
+        "status": "queued" if job else "coalesced",
+        "job_id": job.id if job else next(iter(submission.coalesced.values())),
+        "spiders": spiders,
+        "coalesced": submission.coalesced,
+        "message": (
+            f"Queued {len(job.spiders)} spider(s)" if job else "All spiders are already queued or running"
+        ),
+    }
+
+
+@app.get("/scrape/schedules")
+def list_scrape_schedules():
+    """Per-spider crawl schedules and their next run times."""
+    return get_schedules()
+
+
+@app.get("/scrape/jobs")
+def list_scrape_jobs():
+    """List recent crawl jobs, newest first."""
+    return list_spider_jobs()
+
+
+@app.get("/scrape/jobs/{job_id}")
+def get_scrape_job(job_id: str):
+    """Status, timing and per-spider Scrapy stats of a crawl job."""
+    job = get_spider_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+def _build_scrape_response(result: dict, url: str, extract_type: str) -> schemas.UrlScrapeResponse:
+    """Build the API response for a successful scrape result."""
+    return schemas.UrlScrapeResponse(
+        success=True,
+        url=result.get('final_url', url),
+        title=result.get('title'),
+        content=result['content'],
+        author=result.get('author'),
+        published_date=result.get('published_date'),
+        description=result.get('description'),
+        tags=result.get('tags', []),
+        tables=result.get('tables', []),
+        lists=result.get('lists', []),
+        word_count=result.get('word_count', 0),
+        http_status=result.get('http_status'),
+        extracted_at=datetime.now().isoformat(),
+        extraction_method=result.get('extraction_method', extract_type),
+        engine=result.get('engine'),
+    )
 
 
 @app.post("/scrape/url", response_model=schemas.UrlScrapeResponse)
@@ -236,17 +431,19 @@ async def scrape_custom_url(request: schemas.UrlScrapeRequest):
     Scrape content from any custom URL using httpx (Windows compatible).
     
     This endpoint uses httpx with trafilatura for content extraction.
-    Works on most websites without JavaScript dependencies.
+    Pages that look JavaScript-rendered (app shells, very little text)
+    are re-rendered in a pooled headless browser when Playwright is
+    available; the response's `engine` says which path was used.
     
     Features:
     - ✅ Fast HTTP-based scraping
     - ✅ Smart content extraction using trafilatura
     - ✅ Supports article, text, and structured data extraction
+    - ✅ Automatic browser fallback for JavaScript-heavy sites
     - ✅ Windows compatible (no subprocess issues)
     - ✅ No external service costs
     
     Limitations:
-    - ❌ Cannot handle JavaScript-heavy sites
     - ❌ Cannot bypass CAPTCHAs
     - ❌ No proxy rotation (may be rate-limited)
     
@@ -265,37 +462,20 @@ async def scrape_custom_url(request: schemas.UrlScrapeRequest):
     Returns:
         UrlScrapeResponse with extracted content
     """
-    from scraper_engine.simple_scraper import ScrapeRequestError, scrape_with_httpx
+    from scraper_engine.hybrid import scrape_url
+    from scraper_engine.simple_scraper import ScrapeRequestError
     
     try:
         logger.info(f"Starting scrape for URL: {str(request.url)}")
         
-        # Use simple httpx-based scraper (Windows compatible)
-        result = await scrape_with_httpx(
+        # httpx first; escalates to a headless browser for JS-only pages
+        result = await scrape_url(
             str(request.url),
             request.wait_for,
             request.extract_type,
         )
         
-        # Build response according to schema
-        from datetime import datetime
-        
-        return schemas.UrlScrapeResponse(
-            success=True,
-            url=result.get('final_url', str(request.url)),
-            title=result.get('title'),
-            content=result['content'],
-            author=result.get('author'),
-            published_date=result.get('published_date'),
-            description=result.get('description'),
-            tags=result.get('tags', []),
-            tables=result.get('tables', []),
-            lists=result.get('lists', []),
-            word_count=result.get('word_count', 0),
-            http_status=result.get('http_status'),
-            extracted_at=datetime.now().isoformat(),
-            extraction_method=result.get('extraction_method', request.extract_type)
-        )
+        return _build_scrape_response(result, str(request.url), request.extract_type)
         
     except ScrapeRequestError as e:
         logger.warning(f"Scraping request failed: {e.detail}")
@@ -308,3 +488,59 @@ async def scrape_custom_url(request: schemas.UrlScrapeRequest):
             status_code=500,
             detail=f"Scraping failed: {str(e)}"
         )
+
+
+@app.post("/scrape/batch")
+async def scrape_batch_urls(request: schemas.BatchScrapeRequest):
+    """
+    Scrape many URLs in one request and stream results as NDJSON.
+    
+    URLs are scraped concurrently under a global cap and a per-host cap.
+    Each line of the response is a UrlScrapeResponse object, written as
+    soon as that URL finishes, so results arrive in completion order.
+    Failed URLs produce a line with success=false, the error detail and
+    the HTTP status that POST /scrape/url would have returned.
+    
+    Examples:
+    ```json
+    {
+        "urls": ["https://example.com/a", "https://example.org/b"],
+        "extract_type": "auto",
+        "max_concurrency": 20,
+        "max_per_host": 4
+    }
+    ```
+    
+    Args:
+        request: BatchScrapeRequest with urls and concurrency limits
+        
+    Returns:
+        StreamingResponse of newline-delimited UrlScrapeResponse objects
+    """
+    from scraper_engine.batch import scrape_batch
+
+    urls = [str(url) for url in request.urls]
+    logger.info(f"Starting batch scrape for {len(urls)} URL(s)")
+
+    async def stream_results():
+        async for url, result, error in scrape_batch(
+            urls,
+            request.wait_for,
+            request.extract_type,
+            max_concurrency=request.max_concurrency,
+            max_per_host=request.max_per_host,
+        ):
+            if error is None:
+                response = _build_scrape_response(result, url, request.extract_type)
+            else:
+                response = schemas.UrlScrapeResponse(
+                    success=False,
+                    url=url,
+                    http_status=error.status_code,
+                    extracted_at=datetime.now().isoformat(),
+                    extraction_method=request.extract_type,
+                    error=error.detail,
+                )
+            yield response.model_dump_json() + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
@@ -0,0 +1,7 @@
+-- Columns used by the crawler's upsert pipeline for change detection
+-- content_hash: fingerprint of source/title/summary/tags/published_at; a re-crawled
+--               row is only rewritten when this changes
+-- last_seen_at: when the crawler last saw the URL, changed or not
+
+ALTER TABLE scraped_items ADD COLUMN IF NOT EXISTS content_hash VARCHAR(32);
+ALTER TABLE scraped_items ADD COLUMN IF NOT EXISTS last_seen_at TIMESTAMP DEFAULT now();
@@ -0,0 +1,6 @@
+-- Composite index for newest-first listing and keyset (cursor) pagination
+-- Queries order by (scraped_at DESC, id DESC) and seek with
+-- (scraped_at, id) < (cursor_scraped_at, cursor_id); a b-tree scanned
+-- backwards serves both, so page N costs the same as page 1.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scraped_items_scraped_at_id ON scraped_items (scraped_at, id);
@@ -0,0 +1,13 @@
+-- Full-text search over title, summary and tags
+-- A stored generated tsvector column (title weighted A, summary B, tags C)
+-- kept up to date by Postgres, with a GIN index for @@ matches.
+-- Requires PostgreSQL 12+ (generated columns, jsonb_to_tsvector).
+
+ALTER TABLE scraped_items ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+        setweight(jsonb_to_tsvector('english', coalesce(tags, '[]'::jsonb), '["string"]'), 'C')
+    ) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scraped_items_search_vector ON scraped_items USING gin (search_vector);
@@ -1,11 +1,27 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Column, Computed, Integer, String, Text, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from db import Base
 
+# Text search configuration used for the search_vector column and its queries
+TEXT_SEARCH_CONFIG = "english"
+
+# Title outranks summary, which outranks tags
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(summary, '')), 'B') || "
+    f"setweight(jsonb_to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(tags, '[]'::jsonb), '[\"string\"]'), 'C')"
+)
+
 
 class ScrapedItem(Base):
     __tablename__ = "scraped_items"
+    __table_args__ = (
+        # Serves ORDER BY scraped_at DESC, id DESC and keyset (cursor) pages
+        Index("ix_scraped_items_scraped_at_id", "scraped_at", "id"),
+        Index("ix_scraped_items_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     source = Column(String(100), nullable=False)
@@ -14,4 +30,8 @@ class ScrapedItem(Base):
     summary = Column(Text, nullable=True)
     tags = Column(JSONB, nullable=True)  # list of tags or keywords
     published_at = Column(DateTime, nullable=True)
-    scraped_at = Column(DateTime, server_default=func.now(), nullable=False)
\ No newline at end of file
+    scraped_at = Column(DateTime, server_default=func.now(), nullable=False)
+    content_hash = Column(String(32), nullable=True)  # fingerprint of the stored fields, set by the crawler
+    last_seen_at = Column(DateTime, server_default=func.now(), nullable=True)
+    # Deferred: only queried in WHERE/ORDER BY, never loaded with the row
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=True))
\ No newline at end of file
@@ -1,8 +1,18 @@
 import os
-import asyncio
-import subprocess
+import re
+import logging
+from typing import Any, Dict, List
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import create_engine
+
+from config import DATABASE_URL
+from spider_runner import crawl_spiders
+
+logger = logging.getLogger(__name__)
 
 # Default spiders to run if not specified
 DEFAULT_SPIDERS = [
@@ -19,32 +29,170 @@ SCRAPER_PROJECT_PATH = os.path.abspath(
     )
 )
 
-scheduler = BackgroundScheduler()
+# Per-spider schedules, e.g. "news=every:30m;jobs=cron:0 */6 * * *".
+# Spiders without an entry run every SCRAPE_INTERVAL_HOURS.
+SPIDER_SCHEDULES = os.getenv("SPIDER_SCHEDULES", "")
+SCRAPE_INTERVAL_HOURS = int(os.getenv("SCRAPE_INTERVAL_HOURS", "6"))
+# Random delay added to each run so spiders do not all start at once
+SCRAPE_JITTER_SECONDS = int(os.getenv("SCRAPE_JITTER_SECONDS", "120"))
+# Runs missed (e.g. while the API was down) still fire if this late
+SCRAPE_MISFIRE_GRACE_SECONDS = int(os.getenv("SCRAPE_MISFIRE_GRACE_SECONDS", "3600"))
+# Where schedule state is persisted; "memory" disables persistence
+SCHEDULER_JOBSTORE_URL = os.getenv("SCHEDULER_JOBSTORE_URL", DATABASE_URL)
+
+_JOB_ID_PREFIX = "spider:"
+_INTERVAL_RE = re.compile(r"^(\d+)\s*([smhd])$")
+_INTERVAL_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+
+scheduler = BackgroundScheduler(
+    job_defaults={
+        # One run per spider at a time; a backlog of missed runs collapses into one.
+        "max_instances": 1,
+        "coalesce": True,
+        "misfire_grace_time": SCRAPE_MISFIRE_GRACE_SECONDS,
+    }
+)
+
+
+def run_spiders(spiders: list[str]) -> Dict[str, Dict[str, Any]]:
+    """Run all spiders at once in one worker process; returns per-spider status and stats."""
+    return crawl_spiders(spiders, SCRAPER_PROJECT_PATH)
+
+
+def parse_schedule(spec: str) -> BaseTrigger:
+    """
+    Build a trigger from a schedule spec.
+
+    Args:
+        spec: "every:<n><s|m|h|d>" or "cron:<minute hour day month weekday>"
+
+    Returns:
+        IntervalTrigger or CronTrigger with SCRAPE_JITTER_SECONDS jitter
+
+    Raises:
+        ValueError: Unrecognized spec
+    """
+    kind, _, value = spec.strip().partition(":")
+    kind, value = kind.strip().lower(), value.strip()
+    jitter = SCRAPE_JITTER_SECONDS or None
+
+    if kind in ("every", "interval"):
+        match = _INTERVAL_RE.match(value.lower())
+        if not match:
+            raise ValueError(f"Invalid interval '{value}' (expected e.g. 30m, 6h)")
+        amount, unit = int(match.group(1)), match.group(2)
+        return IntervalTrigger(**{_INTERVAL_UNITS[unit]: amount}, jitter=jitter)
+
+    if kind == "cron":
+        fields = value.split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid cron expression '{value}' (expected 5 fields)")
+        minute, hour, day, month, day_of_week = fields
+        return CronTrigger(
+            minute=minute, hour=hour, day=day, month=month, day_of_week=day_of_week, jitter=jitter
+        )
 
+    raise ValueError(f"Invalid schedule '{spec}' (expected every:<interval> or cron:<expression>)")
 
-def run_spiders(spiders: list[str]) -> None:
-    for spider in spiders:
-        cmd = ["scrapy", "crawl", spider]
-        subprocess.run(cmd, cwd=SCRAPER_PROJECT_PATH, check=True)
 
+def spider_schedules() -> Dict[str, BaseTrigger]:
+    """Trigger for every scheduled spider (DEFAULT_SPIDERS plus SPIDER_SCHEDULES entries)."""
+    schedules = {
+        spider: IntervalTrigger(hours=SCRAPE_INTERVAL_HOURS, jitter=SCRAPE_JITTER_SECONDS or None)
+        for spider in DEFAULT_SPIDERS
+    }
+    for entry in SPIDER_SCHEDULES.split(";"):
+        if not entry.strip():
+            continue
+        spider, sep, spec = entry.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid SPIDER_SCHEDULES entry '{entry}' (expected spider=schedule)")
+        schedules[spider.strip()] = parse_schedule(spec)
+    return schedules
 
-async def run_spiders_async(spiders: list[str]) -> None:
-    await asyncio.to_thread(run_spiders, spiders)
+
+def _configure_jobstore() -> None:
+    """Persist schedules in the database, falling back to memory if it is unreachable."""
+    if SCHEDULER_JOBSTORE_URL.lower() == "memory":
+        return
+    try:
+        engine = create_engine(SCHEDULER_JOBSTORE_URL, pool_pre_ping=True, pool_size=1, max_overflow=1)
+        with engine.connect():
+            pass
+    except Exception as e:
+        logger.warning(f"Scheduler job store unavailable, schedules will not persist: {e}")
+        return
+    scheduler.add_jobstore(SQLAlchemyJobStore(engine=engine), alias="default")
+
+
+def _trigger_key(trigger: BaseTrigger) -> tuple:
+    """What makes two triggers the same schedule (str() leaves out jitter)."""
+    if isinstance(trigger, IntervalTrigger):
+        fields = (trigger.interval,)
+    elif isinstance(trigger, CronTrigger):
+        fields = tuple(str(field) for field in trigger.fields)
+    else:
+        fields = (str(trigger),)
+    return type(trigger).__name__, fields, trigger.jitter, str(getattr(trigger, "timezone", None))
+
+
+def _sync_jobs(schedules: Dict[str, BaseTrigger]) -> None:
+    """
+    Register one job per spider.
+
+    A persisted job whose schedule is unchanged is kept as is, so its
+    stored next run time survives restarts and missed runs fire (once)
+    on startup. Jobs of spiders no longer scheduled are removed.
+    """
+    for job in scheduler.get_jobs():
+        spider = job.id[len(_JOB_ID_PREFIX):] if job.id.startswith(_JOB_ID_PREFIX) else None
+        if spider not in schedules:
+            job.remove()
+
+    for spider, trigger in schedules.items():
+        job_id = f"{_JOB_ID_PREFIX}{spider}"
+        existing = scheduler.get_job(job_id)
+        if existing is not None and _trigger_key(existing.trigger) == _trigger_key(trigger):
+            continue
+        scheduler.add_job(
+            "spider_jobs:submit_spider_job",
+            trigger=trigger,
+            args=[[spider], "schedule"],
+            id=job_id,
+            name=f"crawl {spider}",
+            replace_existing=True,
+        )
 
 
 def start_scheduler() -> None:
     if scheduler.running:
         return
 
-    interval_hours = int(os.getenv("SCRAPE_INTERVAL_HOURS", "6"))
-    scheduler.add_job(
-        run_spiders,
-        trigger=IntervalTrigger(hours=interval_hours),
-        args=[DEFAULT_SPIDERS],
-        id="scrape_job",
-        replace_existing=True,
-    )
-    scheduler.start()
+    schedules = spider_schedules()
+    _configure_jobstore()
+
+    # Load persisted jobs without running them until they are reconciled.
+    scheduler.start(paused=True)
+    # Scheduled runs go through the job queue (spider_jobs), so they
+    # coalesce with manual triggers and never overlap a running crawl.
+    _sync_jobs(schedules)
+    scheduler.resume()
+
+    for job in scheduler.get_jobs():
+        logger.info("Scheduled %s: %s (next run %s)", job.id, job.trigger, job.next_run_time)
+
+
+def get_schedules() -> List[Dict[str, Any]]:
+    """Registered spider schedules and their next run times."""
+    return [
+        {
+            "spider": job.id[len(_JOB_ID_PREFIX):],
+            "trigger": str(job.trigger),
+            "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None,
+        }
+        for job in scheduler.get_jobs()
+        if job.id.startswith(_JOB_ID_PREFIX)
+    ]
 
 
 def stop_scheduler() -> None:
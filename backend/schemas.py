@@ -17,6 +17,17 @@ class ScrapedItemOut(BaseModel):
         from_attributes = True
 
 
+class ScrapedItemListOut(ScrapedItemOut):
+    """List view of an item; summary is absent when excluded."""
+    summary: Optional[str] = None
+
+
+class SearchResultOut(ScrapedItemOut):
+    """Search hit with its relevance and an optional highlighted snippet."""
+    rank: Optional[float] = None
+    snippet: Optional[str] = None
+
+
 # Custom URL Scraping Schemas
 
 class UrlScrapeRequest(BaseModel):
@@ -44,6 +55,53 @@ class UrlScrapeRequest(BaseModel):
         }
 
 
+class BatchScrapeRequest(BaseModel):
+    """Request schema for batch URL scraping."""
+    urls: List[HttpUrl] = Field(
+        ...,
+        description="URLs to scrape (1-1000)",
+        min_length=1,
+        max_length=1000
+    )
+    extract_type: str = Field(
+        default="auto",
+        description="Extraction type: 'auto', 'article', 'text', or 'structured'",
+        pattern="^(auto|article|text|structured)$"
+    )
+    wait_for: Optional[int] = Field(
+        default=2,
+        description="Seconds to wait for page load (1-30)",
+        ge=1,
+        le=30
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        description="Maximum URLs scraped at once (1-100, default from BATCH_MAX_CONCURRENCY)",
+        ge=1,
+        le=100
+    )
+    max_per_host: Optional[int] = Field(
+        default=None,
+        description="Maximum URLs scraped at once per host (1-20, default from BATCH_MAX_PER_HOST)",
+        ge=1,
+        le=20
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "urls": [
+                    "https://example.com/article-1",
+                    "https://example.com/article-2"
+                ],
+                "extract_type": "auto",
+                "wait_for": 2,
+                "max_concurrency": 20,
+                "max_per_host": 4
+            }
+        }
+
+
 class UrlScrapeResponse(BaseModel):
     """Response schema for custom URL scraping."""
     success: bool
@@ -60,6 +118,7 @@ class UrlScrapeResponse(BaseModel):
     http_status: Optional[int] = None
     extracted_at: str
     extraction_method: Optional[str] = None
+    engine: Optional[str] = None
     error: Optional[str] = None
     
     class Config:
@@ -76,6 +135,7 @@ class UrlScrapeResponse(BaseModel):
                 "word_count": 784,
                 "http_status": 200,
                 "extracted_at": "2026-02-01T12:00:00",
-                "extraction_method": "article"
+                "extraction_method": "article",
+                "engine": "httpx"
             }
         }
@@ -5,8 +5,17 @@ This module provides basic web scraping capabilities for any URL
 with stealth mode and smart content extraction.
 """
 
-from .browser_pool import get_browser, close_browser
+from .browser_pool import get_browser, close_browser, borrow_page
 from .extractors import extract_content
+from .http_client import get_http_client, close_http_client
 from .stealth import setup_stealth_page
 
-__all__ = ['get_browser', 'close_browser', 'extract_content', 'setup_stealth_page']
+__all__ = [
+    'get_browser',
+    'close_browser',
+    'borrow_page',
+    'extract_content',
+    'setup_stealth_page',
+    'get_http_client',
+    'close_http_client',
+]
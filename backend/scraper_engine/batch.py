@@ -0,0 +1,76 @@
+"""
+Batch URL Scraping
+
+Fans a list of URLs out through the hybrid scrape_url under a global
+concurrency cap and a per-host cap, yielding each result as soon as it
+finishes so one slow host does not hold up the rest of the batch.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .hybrid import scrape_url
+from .simple_scraper import ScrapeRequestError
+
+logger = logging.getLogger(__name__)
+
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "20"))
+BATCH_MAX_PER_HOST = int(os.getenv("BATCH_MAX_PER_HOST", "4"))
+
+BatchResult = Tuple[str, Optional[Dict[str, Any]], Optional[ScrapeRequestError]]
+
+
+async def scrape_batch(
+    urls: List[str],
+    wait_seconds: int = 2,
+    extract_type: str = "auto",
+    max_concurrency: Optional[int] = None,
+    max_per_host: Optional[int] = None,
+) -> AsyncIterator[BatchResult]:
+    """
+    Scrape many URLs concurrently and yield results in completion order.
+
+    Args:
+        urls: URLs to scrape
+        wait_seconds: Passed through to scrape_url
+        extract_type: 'auto', 'article', 'text', or 'structured'
+        max_concurrency: Global cap on in-flight scrapes
+        max_per_host: Cap on in-flight scrapes per host
+
+    Yields:
+        Tuples of (url, result, error); exactly one of result/error is set
+    """
+    global_slots = asyncio.Semaphore(max_concurrency or BATCH_MAX_CONCURRENCY)
+    per_host = max_per_host or BATCH_MAX_PER_HOST
+    host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    async def run_one(url: str) -> BatchResult:
+        host = (urlsplit(url).hostname or "").lower()
+        host_slot = host_slots.setdefault(host, asyncio.Semaphore(per_host))
+
+        # Wait for the host slot first so requests queued behind a slow
+        # host do not occupy global slots other hosts could use.
+        async with host_slot:
+            async with global_slots:
+                try:
+                    result = await scrape_url(url, wait_seconds, extract_type)
+                    return url, result, None
+                except ScrapeRequestError as e:
+                    logger.warning("Batch scrape failed for %s: %s", url, e.detail)
+                    return url, None, e
+                except Exception as e:
+                    logger.error("Batch scrape error for %s: %s", url, e, exc_info=True)
+                    return url, None, ScrapeRequestError(status_code=500, detail=f"Scraping failed: {e}")
+
+    tasks = [asyncio.create_task(run_one(url)) for url in urls]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # The consumer may stop early (e.g. the client disconnected).
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -2,20 +2,85 @@
 Browser Pool Manager for Playwright
 
 Manages Playwright browser instances with proper lifecycle management.
-Uses a single browser instance to save resources (minimal implementation).
+A single browser process hosts a pool of pre-warmed, reusable contexts;
+borrow a page with `async with borrow_page() as page:`. The pool caps
+concurrent pages, health-checks contexts on return and resets their
+cookies, permissions and web storage, recycles a context
+after BROWSER_CONTEXT_MAX_USES borrows and restarts the browser once its
+memory exceeds BROWSER_MEMORY_LIMIT_MB.
 """
 
 import asyncio
+import importlib.util
+import os
 import platform
 import sys
-from playwright.async_api import async_playwright, Browser, Page
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Set
+from urllib.parse import urlsplit
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 import logging
 
+from .header_profiles import pick_profile
+from .resource_blocking import BROWSER_BLOCK_RESOURCES, ResourceBlocker
+
 logger = logging.getLogger(__name__)
 
+# Pool tuning
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+# Contexts to open at startup; 0 defers launching Chromium to the first render
+BROWSER_POOL_WARM = int(os.getenv("BROWSER_POOL_WARM", "0"))
+BROWSER_CONTEXT_MAX_USES = int(os.getenv("BROWSER_CONTEXT_MAX_USES", "50"))
+# Restart the browser when Chromium's resident memory exceeds this (0 disables)
+BROWSER_MEMORY_LIMIT_MB = int(os.getenv("BROWSER_MEMORY_LIMIT_MB", "1536"))
+# Check memory every N page returns
+BROWSER_MEMORY_CHECK_EVERY = int(os.getenv("BROWSER_MEMORY_CHECK_EVERY", "10"))
+# Seconds to wait for a free page before giving up
+BROWSER_ACQUIRE_TIMEOUT = float(os.getenv("BROWSER_ACQUIRE_TIMEOUT", "30"))
+
+_CONTEXT_OPTIONS = {
+    'viewport': {'width': 1920, 'height': 1080},
+}
+
+_STEALTH_INIT_SCRIPT = """
+    // Overwrite the `navigator.webdriver` property to undefined
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+
+    // Overwrite the `plugins` property to a fake PluginArray
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+
+    // Overwrite the `languages` property
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en'],
+    });
+
+    // Remove automation indicators
+    delete navigator.__proto__.webdriver;
+"""
+
+# Run on each origin a pooled context visited before it is reused
+_CLEAR_STORAGE_SCRIPT = """
+    async () => {
+        localStorage.clear();
+        sessionStorage.clear();
+        if (indexedDB.databases) {
+            for (const db of await indexedDB.databases()) {
+                indexedDB.deleteDatabase(db.name);
+            }
+        }
+    }
+"""
+
 # Global browser instance
 _browser: Browser = None
 _playwright = None
+_pool: "BrowserPool" = None
+# Serializes driver start and browser launch
+_launch_lock = asyncio.Lock()
 
 # Ensure Windows compatibility
 if platform.system() == 'Windows':
@@ -32,38 +97,50 @@ async def get_browser() -> Browser:
     
     Returns:
         Browser: Playwright browser instance
+
+    Raises:
+        BrowserUnavailable: The driver or browser could not be started
     """
     global _browser, _playwright
-    
-    if _browser is None or not _browser.is_connected():
-        logger.info("Launching new Playwright browser...")
-        
-        try:
-            _playwright = await async_playwright().start()
-            
-            # Launch browser with stealth settings
-            _browser = await _playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled',
-                ]
-            )
-            logger.info("Browser launched successfully")
-        except Exception as e:
-            logger.error(f"Failed to launch browser: {e}")
-            raise
-    
-    return _browser
-    
+
+    if _browser is not None and _browser.is_connected():
+        return _browser
+
+    # One launch at a time; borrowers that waited reuse the new browser.
+    async with _launch_lock:
+        if _browser is None or not _browser.is_connected():
+            logger.info("Launching new Playwright browser...")
+
+            try:
+                # Reused when the pool restarts the browser
+                if _playwright is None:
+                    _playwright = await async_playwright().start()
+
+                # Launch browser with stealth settings
+                _browser = await _playwright.chromium.launch(
+                    headless=True,
+                    args=[
+                        '--no-sandbox',
+                        '--disable-setuid-sandbox',
+                        '--disable-dev-shm-usage',
+                        '--disable-blink-features=AutomationControlled',
+                    ]
+                )
+                logger.info("Browser launched successfully")
+            except Exception as e:
+                logger.error(f"Failed to launch browser: {e}")
+                raise BrowserUnavailable(f"Failed to launch browser: {e}") from e
+
     return _browser
 
 
 async def close_browser():
     """Close the browser and cleanup resources."""
-    global _browser, _playwright
+    global _browser, _playwright, _pool
+
+    if _pool:
+        await _pool.close()
+        _pool = None
     
     if _browser:
         await _browser.close()
@@ -79,6 +156,9 @@ async def close_browser():
 async def create_stealth_page(browser: Browser) -> Page:
     """
     Create a new page with stealth settings.
+
+    Each call opens a fresh context; prefer borrow_page(), which reuses
+    pooled contexts.
     
     Args:
         browser: Playwright browser instance
@@ -86,32 +166,302 @@ async def create_stealth_page(browser: Browser) -> Page:
     Returns:
         Page: Configured page with stealth settings
     """
-    context = await browser.new_context(
-        viewport={'width': 1920, 'height': 1080},
-        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
-    )
-    
+    context = await _new_stealth_context(browser)
     page = await context.new_page()
-    
-    # Add stealth scripts
-    await page.add_init_script("""
-        // Overwrite the `navigator.webdriver` property to undefined
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined,
-        });
-        
-        // Overwrite the `plugins` property to a fake PluginArray
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => [1, 2, 3, 4, 5],
-        });
-        
-        // Overwrite the `languages` property
-        Object.defineProperty(navigator, 'languages', {
-            get: () => ['en-US', 'en'],
-        });
-        
-        // Remove automation indicators
-        delete navigator.__proto__.webdriver;
-    """)
-    
+    if BROWSER_BLOCK_RESOURCES:
+        await ResourceBlocker().attach(page)
     return page
+
+
+async def _new_stealth_context(browser: Browser) -> BrowserContext:
+    """Open a context with the stealth settings installed once for all its pages."""
+    # One identity per context, kept for every page it serves.
+    profile = pick_profile(chromium_only=True)
+    context = await browser.new_context(**_CONTEXT_OPTIONS, **profile.context_options())
+    await context.add_init_script(_STEALTH_INIT_SCRIPT)
+    return context
+
+
+class BrowserUnavailable(Exception):
+    """Raised when Playwright or Chromium cannot be started in this environment."""
+
+
+class BrowserPoolExhausted(Exception):
+    """Raised when no page frees up within BROWSER_ACQUIRE_TIMEOUT."""
+
+
+class PooledContext:
+    """A reusable browser context and its usage bookkeeping."""
+
+    def __init__(self, context: BrowserContext, browser: Browser):
+        self.context = context
+        self.browser = browser
+        self.uses = 0
+        self.crashed = False
+        # Origins whose storage must be cleared before the next borrow
+        self.origins: Set[str] = set()
+
+    def visited(self, url: str):
+        """Record the origin of a page served from this context."""
+        parts = urlsplit(url)
+        if parts.scheme in ("http", "https"):
+            self.origins.add(f"{parts.scheme}://{parts.netloc}")
+
+    def is_healthy(self, browser: Optional[Browser]) -> bool:
+        """Usable if not crashed and still owned by the live browser."""
+        return (
+            not self.crashed
+            and browser is self.browser
+            and self.browser.is_connected()
+        )
+
+
+class BrowserPool:
+    """Bounded pool of pre-warmed stealth contexts on the shared browser."""
+
+    def __init__(self, size: int, max_uses: int, memory_limit_mb: int):
+        self.size = size
+        self.max_uses = max_uses
+        self.memory_limit_mb = memory_limit_mb
+        self._slots = asyncio.Semaphore(size)
+        self._idle: List[PooledContext] = []
+        self._cond = asyncio.Condition()
+        self._in_use = 0
+        self._returns = 0
+        self._restart_pending = False
+        self.stats_counters = {
+            "borrows": 0,
+            "contexts_created": 0,
+            "contexts_recycled": 0,
+            "browser_restarts": 0,
+            "blocked_requests": 0,
+            "estimated_bytes_saved": 0,
+        }
+
+    async def warm(self, count: int):
+        """Open up to `count` idle contexts ahead of the first borrow."""
+        browser = await get_browser()
+        while len(self._idle) < min(count, self.size):
+            self._idle.append(await self._create(browser))
+
+    async def _create(self, browser: Browser) -> PooledContext:
+        pooled = PooledContext(await _new_stealth_context(browser), browser)
+        self.stats_counters["contexts_created"] += 1
+        return pooled
+
+    async def _discard(self, pooled: PooledContext):
+        self.stats_counters["contexts_recycled"] += 1
+        try:
+            await pooled.context.close()
+        except Exception as e:
+            logger.debug(f"Closing pooled context failed: {e}")
+
+    async def _checkout(self) -> PooledContext:
+        browser = await get_browser()
+        while self._idle:
+            pooled = self._idle.pop()
+            if pooled.is_healthy(browser):
+                return pooled
+            await self._discard(pooled)
+        return await self._create(browser)
+
+    async def _checkin(self, pooled: PooledContext):
+        pooled.uses += 1
+        if not pooled.is_healthy(_browser) or pooled.uses >= self.max_uses:
+            await self._discard(pooled)
+            return
+        try:
+            # Keep state from leaking between unrelated scrapes.
+            await pooled.context.clear_cookies()
+            await pooled.context.clear_permissions()
+            await self._clear_storage(pooled)
+        except Exception as e:
+            logger.debug(f"Resetting pooled context failed: {e}")
+            await self._discard(pooled)
+            return
+        self._idle.append(pooled)
+
+    async def _clear_storage(self, pooled: PooledContext):
+        """Clear web storage on every origin the context visited."""
+        if not pooled.origins:
+            return
+        page = await pooled.context.new_page()
+        try:
+            # Serve an empty document so no request leaves the browser.
+            await page.route("**/*", lambda route: route.fulfill(status=200, content_type="text/html", body=""))
+            for origin in sorted(pooled.origins):
+                await page.goto(origin)
+                await page.evaluate(_CLEAR_STORAGE_SCRIPT)
+        finally:
+            await page.close()
+        pooled.origins.clear()
+
+    async def _restart_browser(self):
+        """Close every context and the browser; the next borrow relaunches it."""
+        global _browser
+
+        logger.warning("Restarting browser to release memory")
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._discard(pooled)
+        if _browser:
+            try:
+                await _browser.close()
+            except Exception as e:
+                logger.debug(f"Closing browser failed: {e}")
+            _browser = None
+        self.stats_counters["browser_restarts"] += 1
+        self._restart_pending = False
+
+    def _check_memory(self):
+        if self.memory_limit_mb <= 0:
+            return
+        rss_mb = browser_memory_mb()
+        if rss_mb is not None and rss_mb > self.memory_limit_mb:
+            logger.warning(f"Browser memory {rss_mb:.0f}MB exceeds {self.memory_limit_mb}MB")
+            self._restart_pending = True
+
+    @asynccontextmanager
+    async def page(self, blocker: Optional[ResourceBlocker] = None) -> AsyncIterator[Page]:
+        """
+        Borrow a page from a pooled context.
+
+        Args:
+            blocker: Resource blocker to attach; pass one to read its
+                report after the render. Defaults to a ResourceBlocker
+                with the configured rules when BROWSER_BLOCK_RESOURCES
+                is on.
+
+        Yields:
+            Page: Fresh page; it is closed when the block exits
+
+        Raises:
+            BrowserPoolExhausted: No page freed up within BROWSER_ACQUIRE_TIMEOUT
+        """
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=BROWSER_ACQUIRE_TIMEOUT)
+        except asyncio.TimeoutError as exc:
+            raise BrowserPoolExhausted(
+                f"No browser page available after {BROWSER_ACQUIRE_TIMEOUT:g}s"
+            ) from exc
+
+        try:
+            async with self._cond:
+                # A pending restart waits for borrowed pages to drain.
+                await self._cond.wait_for(lambda: not self._restart_pending or self._in_use == 0)
+                if self._restart_pending:
+                    await self._restart_browser()
+                self._in_use += 1
+
+            if blocker is None and BROWSER_BLOCK_RESOURCES:
+                blocker = ResourceBlocker()
+
+            try:
+                pooled = await self._checkout()
+                page = await pooled.context.new_page()
+                if blocker is not None:
+                    await blocker.attach(page)
+            except BaseException:
+                await self._release()
+                raise
+
+            page.once("crash", lambda _: setattr(pooled, "crashed", True))
+            self.stats_counters["borrows"] += 1
+            try:
+                yield page
+            finally:
+                pooled.visited(page.url)
+                try:
+                    await page.close()
+                except Exception:
+                    pooled.crashed = True
+                if blocker is not None:
+                    report = blocker.report()
+                    self.stats_counters["blocked_requests"] += report["blocked_requests"]
+                    self.stats_counters["estimated_bytes_saved"] += report["estimated_bytes_saved"]
+                    logger.debug(f"Render resource report: {report}")
+                await self._checkin(pooled)
+                self._returns += 1
+                if BROWSER_MEMORY_CHECK_EVERY > 0 and self._returns % BROWSER_MEMORY_CHECK_EVERY == 0:
+                    self._check_memory()
+                await self._release()
+        finally:
+            self._slots.release()
+
+    async def _release(self):
+        async with self._cond:
+            self._in_use -= 1
+            self._cond.notify_all()
+
+    async def close(self):
+        """Close all idle contexts."""
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            try:
+                await pooled.context.close()
+            except Exception:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        """Pool occupancy and lifecycle counters."""
+        return {
+            "size": self.size,
+            "in_use": self._in_use,
+            "idle": len(self._idle),
+            **self.stats_counters,
+        }
+
+
+def browser_memory_mb() -> Optional[float]:
+    """
+    Resident memory of the Chromium processes started by this process.
+
+    Returns:
+        Memory in MB, or None if the optional `psutil` package is missing
+    """
+    if importlib.util.find_spec("psutil") is None:
+        return None
+    import psutil
+
+    total = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            name = child.name().lower()
+            if "chrom" in name or "headless_shell" in name:
+                total += child.memory_info().rss
+        except psutil.Error:
+            continue
+    return total / (1024 * 1024)
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Get or create the shared browser context pool.
+
+    Returns:
+        BrowserPool: Pool used by borrow_page()
+    """
+    global _pool
+
+    if _pool is None:
+        _pool = BrowserPool(BROWSER_POOL_SIZE, BROWSER_CONTEXT_MAX_USES, BROWSER_MEMORY_LIMIT_MB)
+        if BROWSER_MEMORY_LIMIT_MB > 0 and importlib.util.find_spec("psutil") is None:
+            logger.warning("BROWSER_MEMORY_LIMIT_MB is set but 'psutil' is missing; memory recycling disabled")
+    return _pool
+
+
+def borrow_page(blocker: Optional[ResourceBlocker] = None):
+    """
+    Borrow a stealth page from the shared pool.
+
+    Usage:
+        async with borrow_page() as page:
+            await page.goto(url)
+
+    Args:
+        blocker: Optional ResourceBlocker whose report the caller wants
+
+    Returns:
+        Async context manager yielding a Page
+    """
+    return get_browser_pool().page(blocker)
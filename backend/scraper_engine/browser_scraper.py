@@ -0,0 +1,89 @@
+"""
+Browser-based Scraper
+
+Renders a page in a pooled headless Chromium page (see browser_pool)
+and runs the same extraction as the httpx scraper on the rendered DOM.
+Used by the hybrid engine for pages that need JavaScript.
+"""
+
+import logging
+from typing import Any, Dict
+
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+from .browser_pool import BrowserPoolExhausted, borrow_page
+from .download import SCRAPE_MAX_BYTES
+from .extraction_pool import ExtractionPoolSaturated, ExtractionWorkerCrashed, run_extraction
+from .rate_limiter import get_rate_limiter
+from .resource_blocking import BROWSER_BLOCK_RESOURCES, ResourceBlocker
+from .simple_scraper import ScrapeRequestError, _extract_page
+
+logger = logging.getLogger(__name__)
+
+
+async def scrape_with_browser(url: str, wait_seconds: int = 2, extract_type: str = "auto") -> Dict[str, Any]:
+    """
+    Scrape a URL by rendering it in a headless browser.
+
+    Args:
+        url: URL to scrape
+        wait_seconds: Longest wait for the network to go idle after load
+        extract_type: 'auto', 'article', 'text', or 'structured'
+
+    Returns:
+        Dictionary with scraped content, like scrape_with_httpx, plus the
+        resource-blocking 'render_report'
+    """
+    logger.info(f"Scraping with browser: {url}")
+
+    timeout_ms = min(60.0, max(20.0, 20.0 + float(wait_seconds))) * 1000
+    blocker = ResourceBlocker() if BROWSER_BLOCK_RESOURCES else None
+    limiter = get_rate_limiter()
+
+    try:
+        async with borrow_page(blocker) as page:
+            await limiter.acquire(url)
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+            status_code = response.status if response else 200
+            limiter.record(url, status_code, response.headers.get("retry-after") if response else None)
+
+            if status_code == 403:
+                raise ScrapeRequestError(status_code=403, detail="Access blocked by target site (HTTP 403).")
+            if status_code >= 400:
+                raise ScrapeRequestError(
+                    status_code=status_code,
+                    detail=f"Target site returned {status_code}. Please retry later.",
+                )
+
+            # Give client-side rendering a chance to finish.
+            try:
+                await page.wait_for_load_state("networkidle", timeout=max(1, wait_seconds) * 1000)
+            except PlaywrightTimeoutError:
+                logger.debug("Network not idle after %ss for %s; using DOM as is", wait_seconds, url)
+
+            html = await page.content()
+            final_url = page.url
+    except BrowserPoolExhausted as exc:
+        raise ScrapeRequestError(status_code=503, detail=f"Browser pool is busy: {exc}") from exc
+    except PlaywrightTimeoutError as exc:
+        raise ScrapeRequestError(status_code=504, detail=f"Page load timed out: {exc}") from exc
+    except PlaywrightError as exc:
+        raise ScrapeRequestError(status_code=502, detail=f"Browser navigation failed: {exc}") from exc
+
+    # Same cap as streamed downloads, counted in characters of the rendered DOM.
+    if len(html) > SCRAPE_MAX_BYTES:
+        raise ScrapeRequestError(status_code=413, detail=f"Rendered page too large (over {SCRAPE_MAX_BYTES} characters)")
+
+    try:
+        extracted_data = await run_extraction(_extract_page, html, final_url, extract_type)
+    except ExtractionPoolSaturated as exc:
+        raise ScrapeRequestError(status_code=503, detail=f"Extraction workers are busy: {exc}") from exc
+    except ExtractionWorkerCrashed as exc:
+        raise ScrapeRequestError(status_code=503, detail=f"Extraction failed: {exc}") from exc
+
+    return {
+        **extracted_data,
+        "final_url": final_url,
+        "http_status": status_code,
+        "render_report": blocker.report() if blocker else None,
+    }
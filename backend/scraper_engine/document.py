@@ -0,0 +1,194 @@
+"""
+Parsed HTML Document
+
+Parses a page into an lxml tree once and shares it across every
+extraction stage (trafilatura content and metadata, title, tags, tables,
+lists), instead of each stage re-parsing the raw HTML.
+
+The text helpers mirror BeautifulSoup's get_text(strip=True) semantics
+so extraction output does not change with the parser. Comments are kept
+in the shared tree for the same reason (they split the surrounding text
+into separate strings, as in BeautifulSoup) and stripped only from the
+copies handed to trafilatura, which parses without them.
+"""
+
+from copy import deepcopy
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import lxml.html
+from lxml import etree
+from lxml.etree import ParserError
+from lxml.html import HtmlElement, HTMLParser
+from trafilatura.utils import decode_file, is_dubious_html, strip_faulty_doctypes
+
+# BeautifulSoup never includes strings inside these tags in get_text().
+_HIDDEN_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+# trafilatura's HTML_PARSER settings, except that comments are kept
+_PARSER = HTMLParser(collect_ids=False, default_doctype=False, encoding="utf-8", remove_comments=False, remove_pis=True)
+
+
+class ParsedDocument:
+    """
+    An HTML page parsed once, shared by all extractors.
+
+    Attributes:
+        html: Raw HTML content
+        url: Source URL, if known
+        tree: Tree as parsed by trafilatura, or None if trafilatura
+            rejected the input as not being HTML
+        root: Root <html> element used by the non-trafilatura stages
+    """
+
+    def __init__(self, html: str, url: Optional[str] = None):
+        self.html = html
+        self.url = url
+        # Parsed like trafilatura's own loader, so (minus comments) its
+        # extraction sees exactly the tree it would have built.
+        self.tree = _load_html(html) if html else None
+        if self.tree is not None:
+            self.root = self.tree.getroottree().getroot()
+        else:
+            self.root = _parse_fallback(html)
+        self._metas: Optional[List[HtmlElement]] = None
+
+    def trafilatura_input(self) -> Optional[HtmlElement]:
+        """
+        Get a tree trafilatura may consume.
+
+        trafilatura cleans the tree it is given in place, so it receives
+        a copy and the shared tree stays intact for the other stages.
+        Comments are removed from the copy, as trafilatura's parser would.
+
+        Returns:
+            A private copy of the tree, or None if the input is not HTML
+        """
+        if self.tree is None:
+            return None
+        tree = deepcopy(self.tree)
+        etree.strip_elements(tree, etree.Comment, with_tail=False)
+        return tree
+
+    def metas(self) -> List[HtmlElement]:
+        """All <meta> elements in document order (cached)."""
+        if self._metas is None:
+            self._metas = list(self.root.iter("meta"))
+        return self._metas
+
+    def find_meta(self, attrs: Dict[str, str]) -> Optional[HtmlElement]:
+        """Return the first <meta> whose attributes match all of attrs."""
+        for meta in self.metas():
+            if all(meta.get(key) == value for key, value in attrs.items()):
+                return meta
+        return None
+
+    def find(self, *tags: str) -> Optional[HtmlElement]:
+        """Return the first element with one of the given tags."""
+        return next(self.root.iter(*tags), None)
+
+    def find_by_attr(self, name: str, value: str) -> Optional[HtmlElement]:
+        """Return the first element whose attribute equals value."""
+        for node in self.root.iter():
+            if isinstance(node.tag, str) and node.get(name) == value:
+                return node
+        return None
+
+    def find_by_class(self, class_name: str) -> Optional[HtmlElement]:
+        """Return the first element carrying the given CSS class."""
+        for node in self.root.iter():
+            if isinstance(node.tag, str) and class_name in (node.get("class") or "").split():
+                return node
+        return None
+
+    def body(self) -> Optional[HtmlElement]:
+        """Return the <body> element, if any."""
+        return self.find("body")
+
+    def strip_tags(self, tags: Iterable[str]):
+        """
+        Remove elements and their content, keeping the text that follows.
+
+        Nodes are emptied in place rather than unlinked, so their tail
+        text stays a separate string (matching BeautifulSoup's decompose()).
+        The metadata cache is reset since removed nodes may contain <meta>.
+        """
+        for node in list(self.root.iter(*tags)):
+            node.clear(keep_tail=True)
+        self._metas = None
+
+
+DocumentInput = Union[str, ParsedDocument]
+
+
+def as_document(html: DocumentInput, url: Optional[str] = None) -> ParsedDocument:
+    """Wrap raw HTML in a ParsedDocument, passing documents through as-is."""
+    if isinstance(html, ParsedDocument):
+        return html
+    return ParsedDocument(html, url)
+
+
+def _load_html(html: str) -> Optional[HtmlElement]:
+    """trafilatura.utils.load_html for strings, parsing with _PARSER."""
+    html = decode_file(html)
+    beginning = html[:50].lower()
+    check_flag = is_dubious_html(beginning)
+    html = strip_faulty_doctypes(html, beginning)
+
+    tree = None
+    fallback_parse = False
+    try:
+        tree = lxml.html.fromstring(html, parser=_PARSER)
+    except ValueError:
+        # "Unicode strings with encoding declaration are not supported."
+        tree = _fromstring_bytes(html)
+        fallback_parse = True
+    except Exception:
+        pass
+    if (tree is None or len(tree) < 1) and not fallback_parse:
+        tree = _fromstring_bytes(html)
+    # Same rejection test as trafilatura: is it (well-formed) HTML at all?
+    if tree is not None and check_flag and len(tree) < 2:
+        tree = None
+    return tree
+
+
+def _fromstring_bytes(html: str) -> Optional[HtmlElement]:
+    try:
+        return lxml.html.fromstring(html.encode("utf8", "surrogatepass"), parser=_PARSER)
+    except Exception:
+        return None
+
+
+def _parse_fallback(html: str) -> HtmlElement:
+    """Parse input trafilatura rejected; always returns an <html> root."""
+    try:
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # Unicode strings with an XML encoding declaration
+            return lxml.html.document_fromstring(html.encode("utf-8"))
+    except (ParserError, ValueError):
+        return lxml.html.document_fromstring("<html><body></body></html>")
+
+
+def iter_strings(node: HtmlElement) -> Iterator[str]:
+    """Yield the text strings of a subtree in document order."""
+    if node.tag in _HIDDEN_TEXT_TAGS:
+        return
+    if node.text:
+        yield node.text
+    for child in node:
+        if isinstance(child.tag, str):
+            yield from iter_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def node_text(node: HtmlElement, separator: str = "") -> str:
+    """Equivalent of BeautifulSoup's get_text(separator, strip=True)."""
+    # Everything below e.g. a <template> is hidden text too.
+    if next(node.iterancestors(*_HIDDEN_TEXT_TAGS), None) is not None:
+        return ""
+    return separator.join(
+        stripped for stripped in (text.strip() for text in iter_strings(node)) if stripped
+    )
@@ -0,0 +1,136 @@
+"""
+Streaming Page Download
+
+Reads response bodies chunk by chunk instead of buffering them whole.
+The declared Content-Type, Content-Length and the first chunk are
+checked up front so binary or oversized responses are aborted early,
+the body is decoded incrementally, and reading stops as soon as
+SCRAPE_MAX_BYTES is exceeded. Peak memory per in-flight scrape is
+therefore bounded by the cap rather than by what the server sends.
+"""
+
+import codecs
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import List
+
+import httpx
+
+# Largest (decompressed) body accepted for extraction
+SCRAPE_MAX_BYTES = int(os.getenv("SCRAPE_MAX_BYTES", str(10 * 1024 * 1024)))
+
+# Declared media types that can never be an HTML page
+_BINARY_TYPE_PREFIXES = ("image/", "audio/", "video/", "font/", "model/")
+_BINARY_TYPES = frozenset({
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/x-tar",
+    "application/x-7z-compressed",
+    "application/x-rar-compressed",
+    "application/vnd.rar",
+    "application/wasm",
+    "application/x-msdownload",
+    "application/vnd.ms-excel",
+    "application/msword",
+})
+# Leading bytes of common binary formats
+_BINARY_SIGNATURES = (
+    b"%PDF-",
+    b"\x89PNG\r\n\x1a\n",
+    b"GIF87a",
+    b"GIF89a",
+    b"\xff\xd8\xff",
+    b"PK\x03\x04",
+    b"\x1f\x8b",
+    b"RIFF",
+    b"OggS",
+    b"fLaC",
+    b"\x7fELF",
+    b"wOFF",
+    b"wOF2",
+    b"7z\xbc\xaf\x27\x1c",
+    b"Rar!\x1a\x07",
+)
+_UTF16_32_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE, codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)
+_SNIFF_BYTES = 1024
+
+
+class DownloadRejected(Exception):
+    """Raised when a response body is too large or not a text document."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+@dataclass
+class DownloadedBody:
+    """Decoded body of a streamed response."""
+    text: str
+    digest: str
+    size: int
+
+
+def _check_declared(response: httpx.Response, max_bytes: int):
+    media_type = response.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+    if media_type.startswith(_BINARY_TYPE_PREFIXES) or media_type in _BINARY_TYPES:
+        raise DownloadRejected(415, f"Unsupported content type: {media_type}")
+
+    content_length = response.headers.get("Content-Length", "")
+    # With Content-Encoding this is the compressed size, which is still
+    # a lower bound of the decoded body.
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise DownloadRejected(413, f"Response too large ({content_length} bytes, limit {max_bytes})")
+
+
+def _check_first_chunk(chunk: bytes, encoding: str):
+    head = chunk[:_SNIFF_BYTES]
+    if head.startswith(_BINARY_SIGNATURES):
+        raise DownloadRejected(415, "Response body is a binary file, not a web page")
+    # NUL bytes are normal in UTF-16/32 text, never in HTML otherwise.
+    wide = encoding.lower().replace("_", "-").startswith(("utf-16", "utf-32")) or head.startswith(_UTF16_32_BOMS)
+    if not wide and b"\x00" in head:
+        raise DownloadRejected(415, "Response body is binary, not a web page")
+
+
+async def read_text_body(response: httpx.Response, max_bytes: int = SCRAPE_MAX_BYTES) -> DownloadedBody:
+    """
+    Stream and decode the body of a response opened with client.stream().
+
+    Decodes exactly like httpx's Response.text, but incrementally.
+
+    Args:
+        response: Streaming response whose body has not been read yet
+        max_bytes: Limit on the decompressed body size
+
+    Returns:
+        DownloadedBody with the decoded text and a digest of the raw bytes
+
+    Raises:
+        DownloadRejected: Body is binary (415) or larger than max_bytes (413)
+    """
+    _check_declared(response, max_bytes)
+
+    encoding = response.encoding or "utf-8"
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    hasher = hashlib.blake2b(digest_size=16)
+    parts: List[str] = []
+    size = 0
+
+    async for chunk in response.aiter_bytes():
+        if not chunk:
+            continue
+        if size == 0:
+            _check_first_chunk(chunk, encoding)
+        size += len(chunk)
+        if size > max_bytes:
+            raise DownloadRejected(413, f"Response too large (over {max_bytes} bytes)")
+        hasher.update(chunk)
+        parts.append(decoder.decode(chunk))
+
+    parts.append(decoder.decode(b"", final=True))
+    return DownloadedBody(text="".join(parts), digest=hasher.hexdigest(), size=size)
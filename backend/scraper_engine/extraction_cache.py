@@ -0,0 +1,138 @@
+"""
+Extraction Result Memoization
+
+Mirrors, tracking-parameter variants and AMP duplicates often serve
+byte-identical HTML under different URLs. This cache keys extraction
+results by a hash of the response body (plus its encoding and the
+extraction type), so identical payloads skip extraction entirely.
+
+Entries expire after a TTL and the cache is bounded by the approximate
+size of the stored results; least recently used entries are evicted
+first. It lives in the API process and is only touched from the event
+loop, so it needs no locking.
+"""
+
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 0 disables the cache
+EXTRACTION_CACHE_MAX_BYTES = int(os.getenv("EXTRACTION_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+EXTRACTION_CACHE_TTL_SECONDS = float(os.getenv("EXTRACTION_CACHE_TTL_SECONDS", "3600"))
+
+CacheKey = Tuple[str, str, str]
+
+
+def content_key(digest: str, encoding: Optional[str], extract_type: str) -> CacheKey:
+    """
+    Build the cache key for a response body.
+
+    Args:
+        digest: Hash of the raw response bytes (computed while streaming)
+        encoding: Charset the body is decoded with
+        extract_type: Extraction mode the result was produced for
+
+    Returns:
+        Hashable cache key
+    """
+    return digest, (encoding or "").lower(), extract_type
+
+
+class ExtractionCache:
+    """LRU/TTL cache of extraction results, bounded by total bytes."""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # key -> (stored_at, size, result)
+        self._entries: "OrderedDict[CacheKey, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None. Results are shared; do not mutate."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stored_at, size, result = entry
+        if self.ttl_seconds > 0 and time.monotonic() - stored_at > self.ttl_seconds:
+            self._remove(key, size)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: CacheKey, result: Dict[str, Any]):
+        """Store a result, evicting least recently used entries past max_bytes."""
+        # Serialized length approximates the memory the result holds.
+        size = len(json.dumps(result, ensure_ascii=False, default=str))
+        if size > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+
+        self._entries[key] = (time.monotonic(), size, result)
+        self._bytes += size
+
+        while self._bytes > self.max_bytes:
+            old_key, (_, old_size, _) = next(iter(self._entries.items()))
+            self._remove(old_key, old_size)
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey, size: int):
+        del self._entries[key]
+        self._bytes -= size
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current usage."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+# Global cache instance
+_cache: ExtractionCache = None
+
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """
+    Get the shared extraction cache.
+
+    Returns:
+        ExtractionCache, or None when EXTRACTION_CACHE_MAX_BYTES is 0
+    """
+    global _cache
+
+    if EXTRACTION_CACHE_MAX_BYTES <= 0:
+        return None
+    if _cache is None:
+        _cache = ExtractionCache(EXTRACTION_CACHE_MAX_BYTES, EXTRACTION_CACHE_TTL_SECONDS)
+    return _cache
@@ -0,0 +1,125 @@
+"""
+Extraction Worker Pool
+
+Runs CPU-bound HTML extraction (trafilatura, HTML parsing, content
+refinement) off the event loop so a single large page cannot stall
+every other in-flight request. Uses a process pool by default, with a
+thread pool option for environments where spawning processes is not
+desirable.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# 'process' or 'thread'
+EXTRACTION_EXECUTOR = os.getenv("EXTRACTION_EXECUTOR", "process").lower()
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", str(os.cpu_count() or 2)))
+# Jobs allowed to queue for the pool before callers have to wait
+EXTRACTION_MAX_PENDING = int(os.getenv("EXTRACTION_MAX_PENDING", str(EXTRACTION_WORKERS * 4)))
+# Seconds a caller waits for a queue slot before giving up
+EXTRACTION_QUEUE_TIMEOUT = float(os.getenv("EXTRACTION_QUEUE_TIMEOUT", "30"))
+
+# Global executor instance
+_executor: Executor = None
+_pending: asyncio.Semaphore = None
+
+
+class ExtractionPoolSaturated(Exception):
+    """Raised when no extraction slot frees up within the queue timeout."""
+
+
+class ExtractionWorkerCrashed(Exception):
+    """Raised when a worker process died mid-job; the pool is rebuilt for later calls."""
+
+
+def get_extraction_executor() -> Executor:
+    """
+    Get or create the extraction executor.
+
+    Returns:
+        Executor: Process or thread pool used for extraction
+    """
+    global _executor
+
+    if _executor is None:
+        if EXTRACTION_EXECUTOR == "thread":
+            _executor = ThreadPoolExecutor(
+                max_workers=EXTRACTION_WORKERS,
+                thread_name_prefix="extraction",
+            )
+        else:
+            # Spawn instead of fork: the API process runs scheduler and
+            # event-loop threads that are unsafe to fork.
+            _executor = ProcessPoolExecutor(
+                max_workers=EXTRACTION_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        logger.info("Extraction pool started (%s, workers=%s)", EXTRACTION_EXECUTOR, EXTRACTION_WORKERS)
+
+    return _executor
+
+
+async def run_extraction(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run an extraction function in the worker pool.
+
+    Waits for a queue slot when the pool is saturated, so load beyond
+    EXTRACTION_MAX_PENDING queues here instead of piling up in the pool.
+
+    Args:
+        func: Module-level (picklable) function to run
+        *args: Picklable arguments for func
+
+    Returns:
+        The function's return value
+
+    Raises:
+        ExtractionPoolSaturated: No slot freed up within EXTRACTION_QUEUE_TIMEOUT
+        ExtractionWorkerCrashed: A worker process died (e.g. OOM) during the job
+    """
+    global _executor, _pending
+
+    if _pending is None:
+        _pending = asyncio.Semaphore(EXTRACTION_MAX_PENDING)
+    # Shutdown may reset _pending while this call is in flight.
+    pending = _pending
+
+    try:
+        await asyncio.wait_for(pending.acquire(), timeout=EXTRACTION_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError as exc:
+        raise ExtractionPoolSaturated(
+            f"No extraction worker available after {EXTRACTION_QUEUE_TIMEOUT:g}s"
+        ) from exc
+
+    executor = get_extraction_executor()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, func, *args)
+    except BrokenProcessPool as exc:
+        # Every job still in a broken pool fails; only the first caller replaces it.
+        if _executor is executor:
+            logger.error("Extraction pool is broken; recreating on next use")
+            _executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+        raise ExtractionWorkerCrashed("An extraction worker crashed; please retry") from exc
+    finally:
+        pending.release()
+
+
+def shutdown_extraction_executor():
+    """Shut down the extraction pool and cancel queued jobs."""
+    global _executor, _pending
+
+    if _executor:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        logger.info("Extraction pool stopped")
+
+    _pending = None
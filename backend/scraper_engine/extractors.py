@@ -6,26 +6,32 @@ Handles articles, blog posts, and general text content.
 """
 
 import trafilatura
-from bs4 import BeautifulSoup
+from itertools import islice
 from typing import Dict, Optional, List
 import logging
 from datetime import datetime
 
+from .document import DocumentInput, as_document, node_text
+
 logger = logging.getLogger(__name__)
 
 
-def extract_content(html: str, url: str, extract_type: str = "auto") -> Dict:
+def extract_content(html: DocumentInput, url: str, extract_type: str = "auto") -> Dict:
     """
     Extract content from HTML using multiple strategies.
     
+    The page is parsed once and the same document is handed to every
+    strategy tried.
+    
     Args:
-        html: Raw HTML content
+        html: Raw HTML content or an already parsed document
         url: Source URL
         extract_type: Type of extraction (auto, article, text, structured)
         
     Returns:
         Dict with extracted content
     """
+    html = as_document(html, url)
     
     if extract_type == "auto":
         # Try article extraction first (best for news/blogs)
@@ -49,35 +55,38 @@ def extract_content(html: str, url: str, extract_type: str = "auto") -> Dict:
         return extract_text(html, url)
 
 
-def extract_article(html: str, url: str) -> Dict:
+def extract_article(html: DocumentInput, url: str) -> Dict:
     """
     Extract article content using trafilatura (specialized for news/blogs).
     
     Args:
-        html: Raw HTML content
+        html: Raw HTML content or an already parsed document
         url: Source URL
         
     Returns:
         Dict with article data
     """
     try:
+        doc = as_document(html, url)
+        tree = doc.trafilatura_input()
+        
         # Use trafilatura for smart article extraction
         extracted = trafilatura.extract(
-            html,
+            tree,
             include_comments=False,
             include_tables=True,
             no_fallback=False,
             favor_precision=True,
             url=url
-        )
+        ) if tree is not None else None
         
-        # Extract metadata
-        metadata = trafilatura.extract_metadata(html)
+        # Extract metadata from a comment-free copy, as trafilatura would parse it
+        metadata = trafilatura.extract_metadata(doc.trafilatura_input()) if doc.tree is not None else None
         
         result = {
             "success": True,
             "url": url,
-            "title": metadata.title if metadata and metadata.title else extract_title(html),
+            "title": metadata.title if metadata and metadata.title else extract_title(doc),
             "content": extracted or "",
             "author": metadata.author if metadata and metadata.author else None,
             "published_date": metadata.date if metadata and metadata.date else None,
@@ -98,39 +107,48 @@ def extract_article(html: str, url: str) -> Dict:
         }
 
 
-def extract_text(html: str, url: str) -> Dict:
+def extract_text(html: DocumentInput, url: str) -> Dict:
     """
     Extract general text content from any webpage.
     
+    Removes navigation and script elements from the document in place,
+    so run trafilatura-based extraction on a shared document first.
+    
     Args:
-        html: Raw HTML content
+        html: Raw HTML content or an already parsed document
         url: Source URL
         
     Returns:
         Dict with text data
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
+        doc = as_document(html, url)
         
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "aside"]):
-            script.decompose()
+        # Get title (before stripping, so headings in <nav> etc. still count)
+        title = extract_title(doc)
         
-        # Get title
-        title = extract_title(html)
+        # Remove script and style elements
+        doc.strip_tags(["script", "style", "nav", "footer", "aside"])
         
         # Get main content
         # Try to find main content areas
         main_content = None
-        for selector in ['main', 'article', '[role="main"]', '.content', '#content']:
-            element = soup.select_one(selector)
-            if element:
-                main_content = element.get_text(separator='\n', strip=True)
+        for find_element in (
+            lambda: doc.find('main'),
+            lambda: doc.find('article'),
+            lambda: doc.find_by_attr('role', 'main'),
+            lambda: doc.find_by_class('content'),
+            lambda: doc.find_by_attr('id', 'content'),
+        ):
+            element = find_element()
+            if element is not None:
+                main_content = node_text(element, '\n')
                 break
         
         # Fallback to body text
         if not main_content:
-            main_content = soup.body.get_text(separator='\n', strip=True) if soup.body else ""
+            body = doc.body()
+            main_content = node_text(body, '\n') if body is not None else ""
         
         # Clean up text
         lines = (line.strip() for line in main_content.splitlines())
@@ -139,8 +157,8 @@ def extract_text(html: str, url: str) -> Dict:
         
         # Extract meta description
         description = None
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc:
+        meta_desc = doc.find_meta({'name': 'description'})
+        if meta_desc is not None:
             description = meta_desc.get('content')
         
         return {
@@ -162,26 +180,26 @@ def extract_text(html: str, url: str) -> Dict:
         }
 
 
-def extract_structured_data(html: str, url: str) -> Dict:
+def extract_structured_data(html: DocumentInput, url: str) -> Dict:
     """
     Extract structured data like tables, lists, etc.
     
     Args:
-        html: Raw HTML content
+        html: Raw HTML content or an already parsed document
         url: Source URL
         
     Returns:
         Dict with structured data
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
+        doc = as_document(html, url)
         
         # Extract tables
         tables = []
-        for table in soup.find_all('table')[:5]:  # Limit to 5 tables
+        for table in islice(doc.root.iter('table'), 5):  # Limit to 5 tables
             rows = []
-            for tr in table.find_all('tr'):
-                cells = [td.get_text(strip=True) for td in tr.find_all(['td', 'th'])]
+            for tr in table.iter('tr'):
+                cells = [node_text(td) for td in tr.iter('td', 'th')]
                 if cells:
                     rows.append(cells)
             if rows:
@@ -189,15 +207,15 @@ def extract_structured_data(html: str, url: str) -> Dict:
         
         # Extract lists
         lists = []
-        for ul in soup.find_all(['ul', 'ol'])[:10]:  # Limit to 10 lists
-            items = [li.get_text(strip=True) for li in ul.find_all('li', recursive=False)]
+        for ul in islice(doc.root.iter('ul', 'ol'), 10):  # Limit to 10 lists
+            items = [node_text(li) for li in ul if li.tag == 'li']
             if items:
                 lists.append(items)
         
         return {
             "success": True,
             "url": url,
-            "title": extract_title(html),
+            "title": extract_title(doc),
             "tables": tables,
             "lists": lists,
             "extracted_at": datetime.now().isoformat(),
@@ -213,33 +231,34 @@ def extract_structured_data(html: str, url: str) -> Dict:
         }
 
 
-def extract_title(html: str) -> Optional[str]:
+def extract_title(html: DocumentInput) -> Optional[str]:
     """
     Extract page title from HTML.
     
     Args:
-        html: Raw HTML content
+        html: Raw HTML content or an already parsed document
         
     Returns:
         Page title or None
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
+        doc = as_document(html)
         
         # Try multiple methods
         # 1. <title> tag
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
+        title = doc.find('title')
+        if title is not None and len(title) == 0 and title.text:
+            return title.text.strip()
         
         # 2. og:title meta tag
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            return og_title['content'].strip()
+        og_title = doc.find_meta({'property': 'og:title'})
+        if og_title is not None and og_title.get('content'):
+            return og_title.get('content').strip()
         
         # 3. h1 tag
-        h1 = soup.find('h1')
-        if h1:
-            return h1.get_text(strip=True)
+        h1 = doc.find('h1')
+        if h1 is not None:
+            return node_text(h1)
         
         return "Untitled"
         
@@ -247,23 +266,25 @@ def extract_title(html: str) -> Optional[str]:
         return "Untitled"
 
 
-def extract_links(html: str, base_url: str) -> List[str]:
+def extract_links(html: DocumentInput, base_url: str) -> List[str]:
     """
     Extract all links from a webpage.
     
     Args:
-        html: Raw HTML content
+        html: Raw HTML content or an already parsed document
         base_url: Base URL for resolving relative links
         
     Returns:
         List of URLs
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
+        doc = as_document(html, base_url)
         links = []
         
-        for a in soup.find_all('a', href=True):
-            href = a['href']
+        for a in doc.root.iter('a'):
+            href = a.get('href')
+            if href is None:
+                continue
             # Make absolute URLs
             if href.startswith('/'):
                 from urllib.parse import urljoin
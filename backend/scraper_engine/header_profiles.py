@@ -0,0 +1,137 @@
+"""
+Rotating Header Profiles
+
+A preloaded, weighted pool of consistent browser identities: each
+profile pairs a User-Agent with the Accept-Language and sec-ch-ua
+client hints that browser actually sends, so a request never mixes a
+Firefox UA with Chrome client hints. Shared by scrape_with_httpx and
+the Playwright contexts in browser_pool.
+
+Selection is O(1): the pool is expanded by weight once at import and
+each pick is a single random.choice.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class HeaderProfile:
+    """One consistent set of identity headers."""
+    user_agent: str
+    accept_language: str
+    locale: str
+    weight: int
+    # Client hints; only Chromium-based browsers send them
+    sec_ch_ua: Optional[str] = None
+    sec_ch_ua_platform: Optional[str] = None
+
+    @property
+    def is_chromium(self) -> bool:
+        return self.sec_ch_ua is not None
+
+    def http_headers(self) -> Dict[str, str]:
+        """Identity headers for a plain HTTP request."""
+        headers = {
+            "User-Agent": self.user_agent,
+            "Accept-Language": self.accept_language,
+        }
+        if self.sec_ch_ua:
+            headers["sec-ch-ua"] = self.sec_ch_ua
+            headers["sec-ch-ua-mobile"] = "?0"
+            headers["sec-ch-ua-platform"] = self.sec_ch_ua_platform
+        return headers
+
+    def context_options(self) -> Dict[str, Any]:
+        """Playwright new_context() options presenting this identity."""
+        return {
+            "user_agent": self.user_agent,
+            "locale": self.locale,
+            "extra_http_headers": {
+                key: value for key, value in self.http_headers().items() if key != "User-Agent"
+            },
+        }
+
+
+_CHROME_120 = '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"'
+_CHROME_121 = '"Not A(Brand";v="99", "Google Chrome";v="121", "Chromium";v="121"'
+_EDGE_121 = '"Not A(Brand";v="99", "Microsoft Edge";v="121", "Chromium";v="121"'
+
+PROFILES: List[HeaderProfile] = [
+    HeaderProfile(
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+        accept_language="en-US,en;q=0.9",
+        locale="en-US",
+        weight=30,
+        sec_ch_ua=_CHROME_121,
+        sec_ch_ua_platform='"Windows"',
+    ),
+    HeaderProfile(
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        accept_language="en-US,en;q=0.9",
+        locale="en-US",
+        weight=20,
+        sec_ch_ua=_CHROME_120,
+        sec_ch_ua_platform='"Windows"',
+    ),
+    HeaderProfile(
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+        accept_language="en-US,en;q=0.9",
+        locale="en-US",
+        weight=15,
+        sec_ch_ua=_CHROME_121,
+        sec_ch_ua_platform='"macOS"',
+    ),
+    HeaderProfile(
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36 Edg/121.0.0.0",
+        accept_language="en-US,en;q=0.9",
+        locale="en-US",
+        weight=10,
+        sec_ch_ua=_EDGE_121,
+        sec_ch_ua_platform='"Windows"',
+    ),
+    HeaderProfile(
+        user_agent="Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        accept_language="en-GB,en;q=0.9",
+        locale="en-GB",
+        weight=5,
+        sec_ch_ua=_CHROME_120,
+        sec_ch_ua_platform='"Linux"',
+    ),
+    HeaderProfile(
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0",
+        accept_language="en-US,en;q=0.5",
+        locale="en-US",
+        weight=10,
+    ),
+    HeaderProfile(
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
+        accept_language="en-US,en;q=0.9",
+        locale="en-US",
+        weight=10,
+    ),
+]
+
+
+def _expand(profiles: List[HeaderProfile]) -> List[HeaderProfile]:
+    """Repeat each profile by its weight so random.choice is weighted."""
+    return [profile for profile in profiles for _ in range(profile.weight)]
+
+
+_WEIGHTED = _expand(PROFILES)
+# Playwright drives Chromium, so browser contexts only get Chromium identities.
+_WEIGHTED_CHROMIUM = _expand([profile for profile in PROFILES if profile.is_chromium])
+
+
+def pick_profile(chromium_only: bool = False) -> HeaderProfile:
+    """
+    Pick a weighted random header profile.
+
+    Args:
+        chromium_only: Only return profiles a Chromium browser can present
+
+    Returns:
+        HeaderProfile
+    """
+    return random.choice(_WEIGHTED_CHROMIUM if chromium_only else _WEIGHTED)
@@ -0,0 +1,113 @@
+"""
+Shared HTTP Client for httpx-based Scraping
+
+Keeps a single app-scoped httpx.AsyncClient so repeated scrapes reuse
+pooled keep-alive connections instead of paying for DNS, TCP and TLS
+setup on every request. Mirrors the lifecycle of the browser pool.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool tuning
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() == "true"
+
+# Global client instance
+_client: httpx.AsyncClient = None
+_host_slots: Dict[str, "_HostSlot"] = {}
+
+
+def _http2_available() -> bool:
+    """HTTP/2 support in httpx needs the optional `h2` package."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared httpx client.
+
+    Returns:
+        httpx.AsyncClient: Pooled client shared by all scrapes
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        http2 = HTTP2_ENABLED
+        if http2 and not _http2_available():
+            logger.warning("HTTP2_ENABLED is set but the 'h2' package is missing; using HTTP/1.1")
+            http2 = False
+
+        _client = httpx.AsyncClient(
+            follow_redirects=True,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        logger.info(
+            "HTTP client created (max_connections=%s, per_host=%s, http2=%s)",
+            HTTP_MAX_CONNECTIONS,
+            HTTP_MAX_CONNECTIONS_PER_HOST,
+            http2,
+        )
+
+    return _client
+
+
+class _HostSlot:
+    """Per-host semaphore and the number of requests holding or awaiting it."""
+
+    def __init__(self):
+        self.semaphore = asyncio.Semaphore(HTTP_MAX_CONNECTIONS_PER_HOST)
+        self.users = 0
+
+
+@asynccontextmanager
+async def host_slot(url: str) -> AsyncIterator[None]:
+    """
+    Hold one of the connection slots capping concurrent requests to the
+    host of a URL. A host's slots are dropped once nobody holds or awaits
+    them, so only hosts with requests in flight are tracked.
+
+    Args:
+        url: Request URL
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    slot = _host_slots.get(host)
+    if slot is None:
+        slot = _host_slots[host] = _HostSlot()
+    slot.users += 1
+    try:
+        async with slot.semaphore:
+            yield
+    finally:
+        slot.users -= 1
+        if slot.users == 0 and _host_slots.get(host) is slot:
+            del _host_slots[host]
+
+
+async def close_http_client():
+    """Close the shared client and release pooled connections."""
+    global _client
+
+    if _client:
+        await _client.aclose()
+        _client = None
+        logger.info("HTTP client closed")
+
+    _host_slots.clear()
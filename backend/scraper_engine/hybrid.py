@@ -0,0 +1,170 @@
+"""
+Hybrid Fetch Engine
+
+Tries the cheap httpx path first and escalates to a pooled headless
+browser only when the fetched HTML looks like it needs JavaScript:
+very few extracted words, a <noscript> "enable JavaScript" shell, or an
+empty SPA mount point. The outcome is remembered per host, so hosts
+that need rendering go straight to the browser and hosts where
+rendering did not help stop escalating.
+"""
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .simple_scraper import ScrapeRequestError, scrape_with_httpx
+
+logger = logging.getLogger(__name__)
+
+HYBRID_ENABLED = os.getenv("HYBRID_ENABLED", "true").lower() == "true"
+# Escalate when httpx extraction yields fewer words than this
+HYBRID_MIN_WORDS = int(os.getenv("HYBRID_MIN_WORDS", "50"))
+# ...or when JS-shell signals are present and it yields fewer than this
+HYBRID_SHELL_MAX_WORDS = int(os.getenv("HYBRID_SHELL_MAX_WORDS", "200"))
+# How long a per-host decision is trusted
+HYBRID_HOST_MEMORY_TTL = float(os.getenv("HYBRID_HOST_MEMORY_TTL", str(6 * 3600)))
+HYBRID_HOST_MEMORY_SIZE = int(os.getenv("HYBRID_HOST_MEMORY_SIZE", "10000"))
+
+ENGINE_HTTPX = "httpx"
+ENGINE_BROWSER = "browser"
+
+# host -> (engine, decided_at)
+_host_engines: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+
+def _host(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+def remembered_engine(url: str) -> Optional[str]:
+    """Engine previously chosen for the URL's host, if still fresh."""
+    host = _host(url)
+    entry = _host_engines.get(host)
+    if entry is None:
+        return None
+    engine, decided_at = entry
+    if time.monotonic() - decided_at > HYBRID_HOST_MEMORY_TTL:
+        del _host_engines[host]
+        return None
+    return engine
+
+
+def remember_engine(url: str, engine: str):
+    """Record the engine that works for the URL's host."""
+    host = _host(url)
+    _host_engines[host] = (engine, time.monotonic())
+    _host_engines.move_to_end(host)
+    while len(_host_engines) > HYBRID_HOST_MEMORY_SIZE:
+        _host_engines.popitem(last=False)
+
+
+def needs_browser(result: Dict[str, Any]) -> bool:
+    """
+    Decide from an httpx result whether the page needs JS rendering.
+
+    Args:
+        result: scrape_with_httpx result
+
+    Returns:
+        True if the page should be rendered in a browser
+    """
+    word_count = result.get("word_count", 0)
+    if word_count < HYBRID_MIN_WORDS:
+        return True
+    return bool(result.get("js_signals")) and word_count < HYBRID_SHELL_MAX_WORDS
+
+
+async def _scrape_with_browser(
+    url: str, wait_seconds: int, extract_type: str
+) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """
+    Render the URL in the browser, never raising.
+
+    Returns:
+        (result, available): result is None if the render failed;
+        available is False when the browser cannot run here at all
+        (Playwright not installed, Chromium failing to launch)
+    """
+    try:
+        from playwright.async_api import Error as PlaywrightError
+        from .browser_pool import BrowserUnavailable
+        from .browser_scraper import scrape_with_browser
+    except ImportError:
+        logger.warning("Browser escalation skipped (Playwright unavailable in this environment)")
+        return None, False
+    try:
+        result = await scrape_with_browser(url, wait_seconds, extract_type)
+    except BrowserUnavailable as e:
+        logger.warning(f"Browser unavailable for {url}: {e}")
+        return None, False
+    except ScrapeRequestError as e:
+        # Busy pool, timeouts, 5xx...: worth another try on the next page.
+        logger.warning(f"Browser scrape failed for {url}: {e.detail}")
+        return None, True
+    except (PlaywrightError, NotImplementedError, OSError, RuntimeError) as e:
+        logger.warning(f"Browser scrape failed for {url}: {e!r}")
+        return None, True
+    return {**result, "engine": ENGINE_BROWSER}, True
+
+
+async def scrape_url(url: str, wait_seconds: int = 2, extract_type: str = "auto") -> Dict[str, Any]:
+    """
+    Scrape a URL with httpx, escalating to a browser when needed.
+
+    Args:
+        url: URL to scrape
+        wait_seconds: Passed to the httpx and browser scrapers
+        extract_type: 'auto', 'article', 'text', or 'structured'
+
+    Returns:
+        Dictionary with scraped content and the 'engine' that produced it
+    """
+    if not HYBRID_ENABLED:
+        return {**await scrape_with_httpx(url, wait_seconds, extract_type), "engine": ENGINE_HTTPX}
+
+    if remembered_engine(url) == ENGINE_BROWSER:
+        rendered, available = await _scrape_with_browser(url, wait_seconds, extract_type)
+        if rendered is not None:
+            return rendered
+        result = {**await scrape_with_httpx(url, wait_seconds, extract_type), "engine": ENGINE_HTTPX}
+        # Only a browser that cannot run moves the host to httpx; a failed
+        # render keeps it on the browser for the next page.
+        if not available:
+            remember_engine(url, ENGINE_HTTPX)
+        return result
+
+    result = {**await scrape_with_httpx(url, wait_seconds, extract_type), "engine": ENGINE_HTTPX}
+    # A host with a fresh decision is not re-evaluated.
+    if remembered_engine(url) is not None or not needs_browser(result):
+        return result
+
+    logger.info(
+        "Escalating %s to browser (words=%s, signals=%s)",
+        url,
+        result.get("word_count", 0),
+        result.get("js_signals"),
+    )
+    rendered, available = await _scrape_with_browser(url, wait_seconds, extract_type)
+    if rendered is None:
+        if not available:
+            remember_engine(url, ENGINE_HTTPX)
+        return result
+
+    # Keep escalating for this host only if rendering actually helped.
+    if rendered.get("word_count", 0) > result.get("word_count", 0):
+        remember_engine(url, ENGINE_BROWSER)
+        return rendered
+    remember_engine(url, ENGINE_HTTPX)
+    return result
+
+
+def engine_stats() -> Dict[str, int]:
+    """Number of hosts currently pinned to each engine."""
+    counts = {ENGINE_HTTPX: 0, ENGINE_BROWSER: 0}
+    for engine, _ in _host_engines.values():
+        counts[engine] += 1
+    return counts
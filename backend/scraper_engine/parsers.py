@@ -0,0 +1,140 @@
+"""
+HTML Parser Backends
+
+Backends answering the DOM queries behind simple_scraper's metadata,
+tag, table, list and fallback helpers. Each backend returns raw text
+(equivalent to BeautifulSoup's get_text(" ", strip=True)); cleanup and
+filtering stay in simple_scraper so every backend yields identical output.
+
+- 'lxml' (default): queries the shared ParsedDocument tree directly,
+  no extra parse.
+- 'bs4': walks a BeautifulSoup tree built from the same document; kept
+  as the reference implementation for parity checks.
+"""
+
+import os
+from itertools import islice
+from typing import Dict, List, Optional, Union
+
+from .document import ParsedDocument, node_text
+
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "lxml").lower()
+
+_BLOCK_TAGS = ("h1", "h2", "h3", "p")
+
+
+class LxmlBackend:
+    """Read the shared lxml tree of a ParsedDocument."""
+
+    name = "lxml"
+
+    def __init__(self, doc: ParsedDocument):
+        self.doc = doc
+
+    def meta_content(self, attrs: Dict[str, str]) -> Optional[str]:
+        """Content of the first <meta> matching attrs, if any."""
+        meta = self.doc.find_meta(attrs)
+        return meta.get("content") if meta is not None else None
+
+    def title(self) -> Optional[str]:
+        """Text of the first <title>, if it holds plain text."""
+        node = self.doc.find("title")
+        if node is None or len(node) != 0:
+            return None
+        return node.text
+
+    def heading(self) -> Optional[str]:
+        """Text of the first <h1>, if any."""
+        node = self.doc.find("h1")
+        return node_text(node, " ") if node is not None else None
+
+    def tables(self, limit: int) -> List[List[List[str]]]:
+        """Cell texts per row for the first `limit` tables."""
+        return [
+            [[node_text(cell, " ") for cell in row.iter("th", "td")] for row in table.iter("tr")]
+            for table in islice(self.doc.root.iter("table"), limit)
+        ]
+
+    def lists(self, limit: int) -> List[List[str]]:
+        """Direct <li> texts for the first `limit` <ul>/<ol> elements."""
+        return [
+            [node_text(item, " ") for item in node if item.tag == "li"]
+            for node in islice(self.doc.root.iter("ul", "ol"), limit)
+        ]
+
+    def blocks(self) -> List[str]:
+        """Texts of all h1-h3 and p elements in document order."""
+        return [node_text(node, " ") for node in self.doc.root.iter(*_BLOCK_TAGS)]
+
+
+class SoupBackend:
+    """Reference backend on BeautifulSoup, as the helpers were originally written."""
+
+    name = "bs4"
+
+    def __init__(self, doc: ParsedDocument):
+        from bs4 import BeautifulSoup
+        import lxml.html
+
+        # Serialize the shared tree rather than re-reading the raw HTML,
+        # so nodes already stripped from the document stay stripped.
+        markup = lxml.html.tostring(doc.root, encoding="unicode")
+        self.soup = BeautifulSoup(markup, "lxml")
+
+    def meta_content(self, attrs: Dict[str, str]) -> Optional[str]:
+        meta = self.soup.find("meta", attrs=attrs)
+        return meta.get("content") if meta else None
+
+    def title(self) -> Optional[str]:
+        return self.soup.title.string if self.soup.title else None
+
+    def heading(self) -> Optional[str]:
+        h1 = self.soup.find("h1")
+        return h1.get_text(" ", strip=True) if h1 else None
+
+    def tables(self, limit: int) -> List[List[List[str]]]:
+        return [
+            [[cell.get_text(" ", strip=True) for cell in row.find_all(["th", "td"])] for row in table.find_all("tr")]
+            for table in self.soup.find_all("table")[:limit]
+        ]
+
+    def lists(self, limit: int) -> List[List[str]]:
+        return [
+            [item.get_text(" ", strip=True) for item in node.find_all("li", recursive=False)]
+            for node in self.soup.find_all(["ul", "ol"])[:limit]
+        ]
+
+    def blocks(self) -> List[str]:
+        return [node.get_text(" ", strip=True) for node in self.soup.find_all(list(_BLOCK_TAGS))]
+
+
+ParserBackend = Union[LxmlBackend, SoupBackend]
+
+_BACKENDS = {
+    LxmlBackend.name: LxmlBackend,
+    SoupBackend.name: SoupBackend,
+}
+
+
+def get_parser_backend(doc: ParsedDocument, name: Optional[str] = None) -> ParserBackend:
+    """
+    Create the configured parser backend for a document.
+
+    Create it after any node stripping, since the bs4 backend snapshots
+    the document when built.
+
+    Args:
+        doc: Parsed page
+        name: Backend name; defaults to HTML_PARSER_BACKEND
+
+    Returns:
+        LxmlBackend or SoupBackend
+    """
+    backend_name = (name or HTML_PARSER_BACKEND).lower()
+    try:
+        backend_cls = _BACKENDS[backend_name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown HTML parser backend '{backend_name}' (expected one of: {', '.join(_BACKENDS)})"
+        ) from None
+    return backend_cls(doc)
@@ -0,0 +1,229 @@
+"""
+Per-Host Rate Limiter
+
+Token bucket per host shared by every fetch, so concurrent scrapes of
+the same site are paced together instead of each request discovering
+the site's throttle on its own.
+
+The rate adapts: a 429 or 503 halves the host's rate and pauses the
+host for the Retry-After period (or an exponential backoff when the
+header is missing); successful responses slowly restore the rate.
+
+At most HOST_RATE_MAX_HOSTS buckets are kept: beyond that, the least
+recently used idle ones (nobody waiting, not slowed down, tokens full)
+are dropped, since a fresh bucket would behave the same.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Steady-state requests per second and burst size per host
+HOST_RATE_PER_SECOND = float(os.getenv("HOST_RATE_PER_SECOND", "5"))
+HOST_BURST = float(os.getenv("HOST_BURST", "5"))
+# Floor the adaptive rate never drops below
+HOST_MIN_RATE_PER_SECOND = float(os.getenv("HOST_MIN_RATE_PER_SECOND", "0.2"))
+# Longest pause honored from Retry-After or backoff
+HOST_MAX_PAUSE_SECONDS = float(os.getenv("HOST_MAX_PAUSE_SECONDS", "60"))
+# Hosts tracked at once; the least recently used idle ones are dropped
+HOST_RATE_MAX_HOSTS = int(os.getenv("HOST_RATE_MAX_HOSTS", "1000"))
+
+THROTTLE_STATUSES = frozenset({429, 503})
+_BASE_BACKOFF_SECONDS = 1.0
+# Share of the base rate restored per successful response
+_RECOVERY_STEP = 0.05
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostBucket:
+    """Token bucket and adaptive pacing state for one host."""
+
+    def __init__(self, rate: float, burst: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.consecutive_throttles = 0
+        self.waiting = 0
+        self.requests = 0
+        self.throttled = 0
+        # Waiters queue FIFO behind the lock
+        self._lock = asyncio.Lock()
+
+    def is_idle(self, now: float) -> bool:
+        """True if dropping the bucket loses nothing: no waiters, no slowdown, tokens full."""
+        return (
+            self.waiting == 0
+            and now >= self.paused_until
+            and self.rate >= self.base_rate
+            and self.tokens + (now - self.updated) * self.rate >= self.burst
+        )
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """Wait until the host may be requested again, then take a token."""
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    if now < self.paused_until:
+                        await asyncio.sleep(self.paused_until - now)
+                        continue
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        self.requests += 1
+                        return
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
+    def record(self, status_code: int, retry_after: Optional[float]):
+        """Adapt the rate to the outcome of a request."""
+        if status_code in THROTTLE_STATUSES:
+            self.throttled += 1
+            self.consecutive_throttles += 1
+            self.rate = max(HOST_MIN_RATE_PER_SECOND, self.rate / 2)
+            if retry_after is None:
+                retry_after = _BASE_BACKOFF_SECONDS * 2 ** (self.consecutive_throttles - 1)
+            pause = min(HOST_MAX_PAUSE_SECONDS, retry_after)
+            self.paused_until = max(self.paused_until, time.monotonic() + pause)
+            # Restart slowly after the pause instead of bursting again.
+            self.tokens = min(self.tokens, 0.0)
+            self.updated = self.paused_until
+        else:
+            self.consecutive_throttles = 0
+            if self.rate < self.base_rate:
+                self.rate = min(self.base_rate, self.rate + self.base_rate * _RECOVERY_STEP)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate_per_second": round(self.rate, 3),
+            "queued": self.waiting,
+            "paused_for_seconds": round(max(0.0, self.paused_until - time.monotonic()), 3),
+            "requests": self.requests,
+            "throttled": self.throttled,
+        }
+
+
+class HostRateLimiter:
+    """Registry of per-host token buckets."""
+
+    def __init__(self, rate: float, burst: float, max_hosts: int = HOST_RATE_MAX_HOSTS):
+        self.rate = rate
+        self.burst = burst
+        self.max_hosts = max_hosts
+        self._buckets: "OrderedDict[str, HostBucket]" = OrderedDict()
+
+    def bucket(self, url: str) -> HostBucket:
+        host = (urlsplit(url).hostname or "").lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            self._evict_idle(self.max_hosts - 1)
+            bucket = HostBucket(self.rate, self.burst)
+            self._buckets[host] = bucket
+        else:
+            self._buckets.move_to_end(host)
+        return bucket
+
+    def _evict_idle(self, limit: int):
+        """Drop least recently used idle buckets until at most `limit` remain."""
+        excess = len(self._buckets) - limit
+        if excess <= 0:
+            return
+        now = time.monotonic()
+        # Busy buckets stay, even over the limit: a second bucket for the
+        # same host would let its requests through unpaced.
+        idle = [host for host, bucket in self._buckets.items() if bucket.is_idle(now)]
+        for host in idle[:excess]:
+            del self._buckets[host]
+
+    async def acquire(self, url: str):
+        """Wait for the host of url to accept another request."""
+        await self.bucket(url).acquire()
+
+    def record(self, url: str, status_code: int, retry_after: Optional[str] = None):
+        """
+        Feed a response back into the host's pacing.
+
+        Args:
+            url: Request URL
+            status_code: Response status
+            retry_after: Raw Retry-After header, if any
+        """
+        bucket = self.bucket(url)
+        bucket.record(status_code, parse_retry_after(retry_after))
+        if status_code in THROTTLE_STATUSES:
+            logger.warning(
+                "Host %s throttled (HTTP %s); rate now %.2f/s",
+                urlsplit(url).hostname,
+                status_code,
+                bucket.rate,
+            )
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host rate, queue depth and throttle counters."""
+        self._evict_idle(self.max_hosts)
+        return {host: bucket.stats() for host, bucket in self._buckets.items()}
+
+
+# Global limiter instance
+_limiter: HostRateLimiter = None
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """
+    Get the shared per-host rate limiter.
+
+    Returns:
+        HostRateLimiter: Limiter used by every fetch
+    """
+    global _limiter
+
+    if _limiter is None:
+        _limiter = HostRateLimiter(HOST_RATE_PER_SECOND, HOST_BURST)
+    return _limiter
+
+
+def reset_rate_limiter():
+    """Drop all host state (e.g. on shutdown, where the event loop goes away)."""
+    global _limiter
+
+    _limiter = None
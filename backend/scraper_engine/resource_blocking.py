@@ -0,0 +1,140 @@
+"""
+Resource Blocking for Browser Renders
+
+Extraction only needs the rendered DOM, so images, fonts, media and
+third-party ad/analytics scripts are dead weight during a render. A
+ResourceBlocker intercepts a page's requests and aborts those matching
+the blocked resource types or the domain denylist.
+
+Blocked requests are never downloaded, so their real size is unknown;
+the bytes-saved figure is an estimate from typical transfer sizes per
+resource type.
+"""
+
+import logging
+import os
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, Optional
+from urllib.parse import urlsplit
+
+from playwright.async_api import Error as PlaywrightError, Page, Request, Route
+
+logger = logging.getLogger(__name__)
+
+
+def _env_set(name: str, default: str) -> FrozenSet[str]:
+    return frozenset(v.strip().lower() for v in os.getenv(name, default).split(",") if v.strip())
+
+
+BROWSER_BLOCK_RESOURCES = os.getenv("BROWSER_BLOCK_RESOURCES", "true").lower() == "true"
+# Playwright resource types: document, stylesheet, image, media, font,
+# script, texttrack, xhr, fetch, eventsource, websocket, manifest, other
+BROWSER_BLOCKED_RESOURCE_TYPES = _env_set("BROWSER_BLOCKED_RESOURCE_TYPES", "image,media,font")
+# Hosts (and their subdomains) whose requests are always aborted
+BROWSER_BLOCKED_DOMAINS = _env_set(
+    "BROWSER_BLOCKED_DOMAINS",
+    ",".join([
+        "doubleclick.net",
+        "googlesyndication.com",
+        "googleadservices.com",
+        "google-analytics.com",
+        "googletagmanager.com",
+        "googletagservices.com",
+        "adservice.google.com",
+        "amazon-adsystem.com",
+        "facebook.net",
+        "connect.facebook.net",
+        "scorecardresearch.com",
+        "quantserve.com",
+        "hotjar.com",
+        "segment.io",
+        "segment.com",
+        "mixpanel.com",
+        "criteo.com",
+        "criteo.net",
+        "taboola.com",
+        "outbrain.com",
+        "adnxs.com",
+        "rubiconproject.com",
+        "pubmatic.com",
+        "moatads.com",
+        "nr-data.net",
+        "clarity.ms",
+    ]),
+)
+
+# Typical transfer size per resource type (HTTP Archive medians, rounded)
+_TYPICAL_BYTES = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 30_000,
+    "script": 25_000,
+    "stylesheet": 15_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+}
+_DEFAULT_TYPICAL_BYTES = 5_000
+
+
+def _host_blocked(host: str, domains: FrozenSet[str]) -> bool:
+    """True if host is a listed domain or one of its subdomains."""
+    while host:
+        if host in domains:
+            return True
+        _, _, host = host.partition(".")
+    return False
+
+
+def _is_main_document(request: Request) -> bool:
+    """True for the top-level page navigation, which must never be blocked."""
+    try:
+        return request.is_navigation_request() and request.frame.parent_frame is None
+    except PlaywrightError:
+        return False
+
+
+class ResourceBlocker:
+    """Aborts unneeded requests of one page and counts what it saved."""
+
+    def __init__(
+        self,
+        resource_types: Optional[Iterable[str]] = None,
+        domains: Optional[Iterable[str]] = None,
+    ):
+        self.resource_types = frozenset(resource_types) if resource_types is not None else BROWSER_BLOCKED_RESOURCE_TYPES
+        self.domains = frozenset(domains) if domains is not None else BROWSER_BLOCKED_DOMAINS
+        self.allowed = 0
+        self.blocked: Counter = Counter()
+
+    async def attach(self, page: Page) -> "ResourceBlocker":
+        """Start intercepting the page's requests."""
+        await page.route("**/*", self._handle)
+        return self
+
+    async def _handle(self, route: Route):
+        request = route.request
+        resource_type = request.resource_type
+        if not _is_main_document(request) and (
+            resource_type in self.resource_types
+            or _host_blocked((urlsplit(request.url).hostname or "").lower(), self.domains)
+        ):
+            self.blocked[resource_type] += 1
+            await route.abort("blockedbyclient")
+            return
+        self.allowed += 1
+        await route.continue_()
+
+    def estimated_bytes_saved(self) -> int:
+        return sum(
+            count * _TYPICAL_BYTES.get(resource_type, _DEFAULT_TYPICAL_BYTES)
+            for resource_type, count in self.blocked.items()
+        )
+
+    def report(self) -> Dict[str, object]:
+        """Blocked/allowed request counts and the estimated bytes saved."""
+        return {
+            "allowed_requests": self.allowed,
+            "blocked_requests": sum(self.blocked.values()),
+            "blocked_by_type": dict(self.blocked),
+            "estimated_bytes_saved": self.estimated_bytes_saved(),
+        }
@@ -0,0 +1,243 @@
+"""
+Conditional-Request Response Cache
+
+Persists HTTP validators (ETag / Last-Modified) and the extracted result
+per normalized URL and extraction type in a local SQLite file. Repeat
+scrapes send If-None-Match / If-Modified-Since and reuse the stored
+extraction when the site answers 304 Not Modified, so unchanged pages
+cost neither bandwidth nor extraction CPU.
+
+The cache is bounded by total stored bytes; least recently used entries
+are evicted first.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+SCRAPE_CACHE_ENABLED = os.getenv("SCRAPE_CACHE_ENABLED", "true").lower() == "true"
+SCRAPE_CACHE_PATH = os.path.abspath(
+    os.getenv(
+        "SCRAPE_CACHE_PATH",
+        os.path.join(os.path.dirname(__file__), "..", ".cache", "scrape_cache.sqlite3"),
+    )
+)
+SCRAPE_CACHE_MAX_BYTES = int(os.getenv("SCRAPE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Least recently used rows deleted per eviction query
+_EVICT_BATCH = 100
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@dataclass
+class CachedResponse:
+    """Validators and extraction result stored for one URL."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    result: Dict[str, Any]
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers asking the server to revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL into a cache key.
+
+    Lowercases scheme and host, drops default ports and fragments,
+    and sorts query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of validators and extraction results in SQLite."""
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Running total of stored bytes, summed once when the database opens
+        self._total_bytes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    url_key TEXT NOT NULL,
+                    extract_type TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    result TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (url_key, extract_type)
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at)"
+            )
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        return self._conn
+
+    def get(self, url: str, extract_type: str) -> Optional[CachedResponse]:
+        """Look up the stored entry for a URL and extraction type."""
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT etag, last_modified, result FROM responses WHERE url_key = ? AND extract_type = ?",
+                    (normalize_url(url), extract_type),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        return CachedResponse(etag=row[0], last_modified=row[1], result=json.loads(row[2]))
+
+    def touch(self, url: str, extract_type: str):
+        """Mark an entry as recently used after a successful revalidation."""
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE url_key = ? AND extract_type = ?",
+                    (time.time(), normalize_url(url), extract_type),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache update failed: {e}")
+
+    def put(
+        self,
+        url: str,
+        extract_type: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        result: Dict[str, Any],
+    ):
+        """Store validators and result, evicting old entries past max_bytes."""
+        payload = json.dumps(result, ensure_ascii=False)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                key = normalize_url(url)
+                previous = conn.execute(
+                    "SELECT size FROM responses WHERE url_key = ? AND extract_type = ?",
+                    (key, extract_type),
+                ).fetchone()
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO responses
+                        (url_key, extract_type, etag, last_modified, result, size, accessed_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, extract_type, etag, last_modified, payload, size, time.time()),
+                )
+                total = self._total_bytes + size - (previous[0] if previous else 0)
+                total = self._evict(conn, total)
+                conn.commit()
+                self._total_bytes = total
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+            # The transaction was not committed; recount on next use.
+            self.close()
+
+    def _evict(self, conn: sqlite3.Connection, total: int) -> int:
+        """
+        Delete least recently used entries until under max_bytes.
+
+        Args:
+            conn: Open connection (caller holds the lock)
+            total: Stored bytes including the entry just written
+
+        Returns:
+            Stored bytes after eviction
+        """
+        evicted = 0
+        while total > self.max_bytes:
+            rows = conn.execute(
+                "SELECT rowid, size FROM responses ORDER BY accessed_at LIMIT ?", (_EVICT_BATCH,)
+            ).fetchall()
+            if not rows:
+                break
+            # Only as many of the oldest rows as needed to get under the limit
+            victims = []
+            for rowid, size in rows:
+                victims.append(rowid)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+            conn.execute(
+                f"DELETE FROM responses WHERE rowid IN ({','.join('?' * len(victims))})", victims
+            )
+            evicted += len(victims)
+        if evicted:
+            logger.info("Response cache evicted %s entries", evicted)
+        return total
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Global cache instance
+_cache: ResponseCache = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the shared response cache.
+
+    Returns:
+        ResponseCache, or None when SCRAPE_CACHE_ENABLED is false
+    """
+    global _cache
+
+    if not SCRAPE_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = ResponseCache(SCRAPE_CACHE_PATH, SCRAPE_CACHE_MAX_BYTES)
+    return _cache
+
+
+def close_response_cache():
+    """Close the cache database."""
+    global _cache
+
+    if _cache:
+        _cache.close()
+        _cache = None
@@ -12,10 +12,23 @@ from typing import Any, Dict, List
 
 import httpx
 import trafilatura
-from bs4 import BeautifulSoup
+from lxml.etree import XPath
+
+from .document import ParsedDocument, node_text
+from .download import DownloadedBody, DownloadRejected, read_text_body
+from .extraction_cache import content_key, get_extraction_cache
+from .extraction_pool import ExtractionPoolSaturated, ExtractionWorkerCrashed, run_extraction
+from .header_profiles import pick_profile
+from .http_client import get_http_client, host_slot
+from .parsers import ParserBackend, get_parser_backend
+from .rate_limiter import THROTTLE_STATUSES, get_rate_limiter
+from .response_cache import get_response_cache
 
 logger = logging.getLogger(__name__)
 
+# Elements whose content never contributes readable text.
+_NOISE_TAGS = ("script", "style", "noscript", "svg")
+
 
 class ScrapeRequestError(Exception):
     """Structured scrape error with HTTP status mapping."""
@@ -25,6 +38,10 @@ class ScrapeRequestError(Exception):
         self.status_code = status_code
         self.detail = detail
 
+    def __reduce__(self):
+        # Keep the error picklable across the extraction process pool.
+        return (self.__class__, (self.status_code, self.detail))
+
 
 def _normalize_text(text: str) -> str:
     """Normalize whitespace and remove noisy empty lines."""
@@ -32,54 +49,67 @@ def _normalize_text(text: str) -> str:
         return ""
 
     text = text.replace("\r\n", "\n").replace("\r", "\n")
-    lines = [re.sub(r"\s+", " ", line).strip() for line in text.split("\n")]
+    # str.split() collapses the same Unicode whitespace as re's \s+.
+    lines = [" ".join(line.split()) for line in text.split("\n")]
     lines = [line for line in lines if line]
     return "\n".join(lines)
 
 
-def _is_noise_line(line: str) -> bool:
-    """Detect low-information lines that commonly pollute scraped output."""
-    if not line:
-        return True
+# Lines that are pure storefront/status noise.
+_NOISE_PHRASES = frozenset({
+    "in stock",
+    "out of stock",
+    "add to basket",
+    "add to cart",
+    "read more",
+})
+
+# Prices (optionally followed by stock status) and bare numbers.
+_PRICE_OR_NUMBER_RE = re.compile(
+    r"[£$€]\s?\d+(?:\.\d{1,2})?(?:\s+(?:in stock|out of stock))?"
+    r"|\d+(?:\.\d+)?"
+)
+_ALPHA_RE = re.compile(r"[a-z]")
+
+# Length limit (without whitespace) for the short-line heuristics.
+_SHORT_LINE_CHARS = 24
 
-    normalized = line.replace("\xa0", " ").strip().lower()
-    compact = re.sub(r"\s+", "", normalized)
-    alpha_count = len(re.findall(r"[a-z]", normalized))
 
+def _is_noise_normalized(normalized: str) -> bool:
+    """Classify a line that is already stripped, lowercased and free of NBSPs."""
     # Common storefront/status noise.
-    if normalized in {
-        "in stock",
-        "out of stock",
-        "add to basket",
-        "add to cart",
-        "read more",
-    }:
+    if normalized in _NOISE_PHRASES:
         return True
 
     # Currency, numeric-only, and common catalog stock lines.
-    if re.fullmatch(r"[£$€]\s?\d+(?:\.\d{1,2})?", normalized):
-        return True
-    if re.fullmatch(r"[£$€]\s?\d+(?:\.\d{1,2})?\s+(in stock|out of stock)", normalized):
-        return True
-    if re.fullmatch(r"\d+(?:\.\d+)?", normalized):
+    if _PRICE_OR_NUMBER_RE.fullmatch(normalized):
         return True
 
+    # Every remaining rule only applies to short lines, which lets the
+    # long text lines that make up most of a page exit here.
+    compact_length = len("".join(normalized.split()))
+    if compact_length > _SHORT_LINE_CHARS:
+        return False
+
     # Encoding-agnostic fallback for catalog stock lines and symbol-heavy snippets.
     if "in stock" in normalized or "out of stock" in normalized:
-        if len(normalized) <= 24:
+        if len(normalized) <= _SHORT_LINE_CHARS:
             return True
 
-    if alpha_count == 0 and len(compact) <= 24:
+    # Lines with no letters (including very short UI noise like "|" or "»").
+    alpha_count = len(_ALPHA_RE.findall(normalized))
+    if alpha_count == 0:
         return True
 
-    if len(compact) > 0 and (alpha_count / len(compact)) < 0.2 and len(compact) <= 24:
-        return True
+    return (alpha_count / compact_length) < 0.2
 
-    # Very short lines with no letters are usually UI noise.
-    if len(normalized) <= 3 and not re.search(r"[a-z]", normalized):
+
+def _is_noise_line(line: str) -> bool:
+    """Detect low-information lines that commonly pollute scraped output."""
+    if not line:
         return True
 
-    return False
+    return _is_noise_normalized(line.replace("\xa0", " ").strip().lower())
 
 
 def _refine_content(text: str) -> str:
@@ -88,14 +118,16 @@ def _refine_content(text: str) -> str:
     if not normalized:
         return ""
 
+    # Lowercase the whole document once instead of line by line. After
+    # _normalize_text every line is stripped and NBSP-free, so each
+    # lowered line is both its noise-classifier input and its dedupe key.
+    lines = normalized.split("\n")
+    lowered_lines = normalized.lower().split("\n")
+
     seen = set()
     refined_lines: List[str] = []
-    for line in normalized.split("\n"):
-        if _is_noise_line(line):
-            continue
-
-        key = line.strip().lower()
-        if key in seen:
+    for line, key in zip(lines, lowered_lines):
+        if key in seen or _is_noise_normalized(key):
             continue
 
         seen.add(key)
@@ -107,12 +139,12 @@ def _refine_content(text: str) -> str:
     return "\n".join(refined_lines)
 
 
-def _build_semantic_fallback(soup: BeautifulSoup) -> str:
+def _build_semantic_fallback(parser: ParserBackend) -> str:
     """Build readable fallback content from meaningful headings/paragraphs."""
     chunks: List[str] = []
 
-    for node in soup.select("main h1, main h2, main h3, article h1, article h2, article h3, main p, article p, h1, h2, h3, p"):
-        text = _normalize_text(node.get_text(" ", strip=True))
+    for block in parser.blocks():
+        text = _normalize_text(block)
         if not text:
             continue
 
@@ -129,23 +161,23 @@ def _build_semantic_fallback(soup: BeautifulSoup) -> str:
     return "\n".join(unique_chunks[:120])
 
 
-def _extract_meta_content(soup: BeautifulSoup, selectors: List[Dict[str, str]]) -> str | None:
+def _extract_meta_content(parser: ParserBackend, selectors: List[Dict[str, str]]) -> str | None:
     """Return the first non-empty meta content from candidate selectors."""
     for attrs in selectors:
-        meta = soup.find("meta", attrs=attrs)
-        if meta and meta.get("content"):
-            value = meta.get("content", "").strip()
+        content = parser.meta_content(attrs)
+        if content:
+            value = content.strip()
             if value:
                 return value
     return None
 
 
-def _extract_tags(soup: BeautifulSoup) -> List[str]:
+def _extract_tags(parser: ParserBackend) -> List[str]:
     """Extract and normalize tags from common metadata fields."""
     tags: List[str] = []
 
     keyword_content = _extract_meta_content(
-        soup,
+        parser,
         [
             {"name": "keywords"},
             {"property": "article:tag"},
@@ -164,12 +196,12 @@ def _extract_tags(soup: BeautifulSoup) -> List[str]:
     return unique_tags[:20]
 
 
-def _extract_tables(soup: BeautifulSoup, limit: int = 5) -> List[List[List[str]]]:
+def _extract_tables(parser: ParserBackend, limit: int = 5) -> List[List[List[str]]]:
     tables: List[List[List[str]]] = []
-    for table in soup.find_all("table")[:limit]:
+    for table in parser.tables(limit):
         table_data: List[List[str]] = []
-        for row in table.find_all("tr"):
-            cells = [_normalize_text(cell.get_text(" ", strip=True)) for cell in row.find_all(["th", "td"])]
+        for row in table:
+            cells = [_normalize_text(cell) for cell in row]
             cells = [cell for cell in cells if cell]
             if cells:
                 table_data.append(cells)
@@ -178,10 +210,10 @@ def _extract_tables(soup: BeautifulSoup, limit: int = 5) -> List[List[List[str]]
     return tables
 
 
-def _extract_lists(soup: BeautifulSoup, limit: int = 10) -> List[List[str]]:
+def _extract_lists(parser: ParserBackend, limit: int = 10) -> List[List[str]]:
     lists: List[List[str]] = []
-    for node in soup.find_all(["ul", "ol"])[:limit]:
-        items = [_normalize_text(li.get_text(" ", strip=True)) for li in node.find_all("li", recursive=False)]
+    for raw_items in parser.lists(limit):
+        items = [_normalize_text(item) for item in raw_items]
         items = [item for item in items if item and len(item) > 1]
         # Keep lists with meaningful content only.
         if len(items) >= 2:
@@ -189,103 +221,95 @@ def _extract_lists(soup: BeautifulSoup, limit: int = 10) -> List[List[str]]:
     return lists
 
 
-async def scrape_with_httpx(url: str, wait_seconds: int = 2, extract_type: str = "auto") -> Dict[str, Any]:
-    """
-    Scrape a URL using httpx (no browser automation).
-    
-    Args:
-        url: URL to scrape
-        wait_seconds: Kept for compatibility; influences timeout/retry pacing
-        extract_type: 'auto', 'article', 'text', or 'structured'
-        
-    Returns:
-        Dictionary with scraped content
-    """
-    logger.info(f"Scraping with httpx: {url}")
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Connection': 'keep-alive',
-    }
-    
-    timeout_seconds = min(60.0, max(20.0, 20.0 + float(wait_seconds)))
-    retries = 3
-    response: httpx.Response | None = None
+def _extract_article_content(doc: ParsedDocument, url: str) -> str | None:
+    """Run trafilatura's article extraction on the shared tree."""
+    tree = doc.trafilatura_input()
+    if tree is None:
+        return None
+
+    return trafilatura.extract(
+        tree,
+        include_comments=False,
+        include_tables=True,
+        include_images=False,
+        favor_precision=True,
+        no_fallback=False,
+        url=url,
+    )
 
-    async with httpx.AsyncClient(follow_redirects=True, timeout=timeout_seconds) as client:
-        for attempt in range(1, retries + 1):
-            try:
-                response = await client.get(url, headers=headers)
 
-                # Retry transient upstream failures.
-                if response.status_code in {429, 500, 502, 503, 504}:
-                    if attempt < retries:
-                        delay = attempt * max(1, wait_seconds)
-                        logger.warning(
-                            "Transient status %s for %s (attempt %s/%s). Retrying in %ss.",
-                            response.status_code,
-                            url,
-                            attempt,
-                            retries,
-                            delay,
-                        )
-                        await asyncio.sleep(delay)
-                        continue
-
-                    raise ScrapeRequestError(
-                        status_code=response.status_code,
-                        detail=f"Target site returned {response.status_code}. Please retry later.",
-                    )
+def _select_main_node(doc: ParsedDocument):
+    """Pick the element most likely to hold the main page content."""
+    node = doc.find("main")
+    if node is None:
+        node = doc.find("article")
+    if node is None:
+        node = doc.find_by_attr("role", "main")
+    if node is None:
+        node = doc.body()
+    if node is None:
+        node = doc.root
+    return node
+
+
+# Mount points client-side frameworks render into (React, Vue, Next,
+# Nuxt, Gatsby, Svelte, Angular); empty ones mean the HTML is an app shell.
+_SPA_MOUNT_XPATH = XPath(
+    "//*[@id='root' or @id='app' or @id='__next' or @id='__nuxt' or @id='___gatsby' or @id='svelte']"
+    " | //app-root"
+)
+_NOSCRIPT_JS_RE = re.compile(
+    r"(?:enable|requires?|turn on|need)\W+(?:\w+\W+){0,3}?javascript"
+    r"|javascript\W+(?:is\W+)?(?:required|disabled|must be enabled)",
+    re.IGNORECASE,
+)
+
+
+def _detect_js_signals(doc: ParsedDocument) -> List[str]:
+    """
+    Look for signs that the page only renders with JavaScript.
 
-                if response.status_code == 403:
-                    raise ScrapeRequestError(
-                        status_code=403,
-                        detail="Access blocked by target site (HTTP 403).",
-                    )
+    Must run before noise stripping, which empties <noscript>.
 
-                response.raise_for_status()
-                break
+    Returns:
+        Signal names: 'noscript_shell', 'empty_mount'
+    """
+    signals = []
+    for node in doc.root.iter("noscript"):
+        if _NOSCRIPT_JS_RE.search(node.text_content()):
+            signals.append("noscript_shell")
+            break
+    for node in _SPA_MOUNT_XPATH(doc.root):
+        if not node_text(node):
+            signals.append("empty_mount")
+            break
+    return signals
+
+
+def _extract_page(html: str, url: str, extract_type: str) -> Dict[str, Any]:
+    """
+    Extract content and metadata from downloaded HTML.
 
-            except ScrapeRequestError:
-                raise
-            except httpx.TimeoutException as exc:
-                if attempt < retries:
-                    delay = attempt * max(1, wait_seconds)
-                    logger.warning("Timeout scraping %s (attempt %s/%s). Retrying in %ss.", url, attempt, retries, delay)
-                    await asyncio.sleep(delay)
-                    continue
-                raise ScrapeRequestError(status_code=504, detail=f"Request timed out: {exc}") from exc
-            except httpx.TransportError as exc:
-                if attempt < retries:
-                    delay = attempt * max(1, wait_seconds)
-                    logger.warning("Transport error scraping %s (attempt %s/%s). Retrying in %ss.", url, attempt, retries, delay)
-                    await asyncio.sleep(delay)
-                    continue
-                raise ScrapeRequestError(status_code=502, detail=f"Transport error: {exc}") from exc
+    CPU-bound; runs in the extraction pool, so it must stay a picklable
+    module-level function.
 
-    if response is None:
-        raise ScrapeRequestError(status_code=500, detail="Unknown error: no response received")
+    Args:
+        html: Decoded page HTML
+        url: Final URL of the page
+        extract_type: 'auto', 'article', 'text', or 'structured'
 
-    html = response.text or ""
-    if not html.strip():
-        raise ScrapeRequestError(status_code=502, detail="Target site returned an empty response")
+    Returns:
+        Dictionary with extracted content and metadata, plus the
+        'js_signals' used to decide on browser rendering
+    """
+    # Parse once; every stage below reads the same tree.
+    doc = ParsedDocument(html, url)
+    js_signals = _detect_js_signals(doc)
 
-    logger.info("Got %s bytes from %s", len(html), response.url)
-    
     # Extract content using trafilatura
     try:
         if extract_type == "article":
-            extracted = trafilatura.extract(
-                html,
-                include_comments=False,
-                include_tables=True,
-                include_images=False,
-                favor_precision=True,
-                no_fallback=False,
-                url=str(response.url),
-            )
+            extracted = _extract_article_content(doc, url)
             extraction_method = "article"
         elif extract_type == "text":
             extracted = None
@@ -294,31 +318,12 @@ async def scrape_with_httpx(url: str, wait_seconds: int = 2, extract_type: str =
             extracted = None
             extraction_method = "structured"
         else:
-            extracted = trafilatura.extract(
-                html,
-                include_comments=False,
-                include_tables=True,
-                include_images=False,
-                favor_precision=True,
-                no_fallback=False,
-                url=str(response.url),
-            )
+            extracted = _extract_article_content(doc, url)
             extraction_method = "article" if extracted else "text"
 
-        soup = BeautifulSoup(html, "lxml")
-
         if not extracted:
-            for noisy in soup(["script", "style", "noscript", "svg"]):
-                noisy.decompose()
-
-            main_node = (
-                soup.select_one("main")
-                or soup.select_one("article")
-                or soup.select_one("[role='main']")
-                or soup.body
-                or soup
-            )
-            extracted = main_node.get_text(separator="\n", strip=True)
+            doc.strip_tags(_NOISE_TAGS)
+            extracted = node_text(_select_main_node(doc), "\n")
 
         # In auto mode, recover from low-density article extraction.
         if extract_type == "auto" and extracted:
@@ -326,25 +331,19 @@ async def scrape_with_httpx(url: str, wait_seconds: int = 2, extract_type: str =
             article_word_count = len(normalized_article.split())
 
             if article_word_count < 80:
-                for noisy in soup(["script", "style", "noscript", "svg"]):
-                    noisy.decompose()
-
-                main_node = (
-                    soup.select_one("main")
-                    or soup.select_one("article")
-                    or soup.select_one("[role='main']")
-                    or soup.body
-                    or soup
-                )
-                fallback_text = _normalize_text(main_node.get_text(separator="\n", strip=True))
+                doc.strip_tags(_NOISE_TAGS)
+                fallback_text = _normalize_text(node_text(_select_main_node(doc), "\n"))
 
                 if len(fallback_text.split()) > article_word_count:
                     extracted = fallback_text
                     extraction_method = "text"
 
+        # Built after any node stripping above; see get_parser_backend.
+        parser = get_parser_backend(doc)
+
         extracted = _refine_content(extracted)
         if not extracted:
-            extracted = _build_semantic_fallback(soup)
+            extracted = _build_semantic_fallback(parser)
     except ScrapeRequestError:
         raise
     except Exception as e:
@@ -352,14 +351,16 @@ async def scrape_with_httpx(url: str, wait_seconds: int = 2, extract_type: str =
         raise ScrapeRequestError(status_code=500, detail=f"Content extraction failed: {e}") from e
     
     # Extract metadata
+    page_title = parser.title()
+    heading = parser.heading()
     title = (
-        _extract_meta_content(soup, [{"property": "og:title"}, {"name": "twitter:title"}])
-        or (_normalize_text(soup.title.string) if soup.title and soup.title.string else None)
-        or (_normalize_text(soup.find("h1").get_text(" ", strip=True)) if soup.find("h1") else None)
+        _extract_meta_content(parser, [{"property": "og:title"}, {"name": "twitter:title"}])
+        or (_normalize_text(page_title) if page_title else None)
+        or (_normalize_text(heading) if heading is not None else None)
     )
 
     author = _extract_meta_content(
-        soup,
+        parser,
         [
             {"name": "author"},
             {"property": "article:author"},
@@ -367,7 +368,7 @@ async def scrape_with_httpx(url: str, wait_seconds: int = 2, extract_type: str =
     )
 
     published_date = _extract_meta_content(
-        soup,
+        parser,
         [
             {"property": "article:published_time"},
             {"name": "date"},
@@ -376,7 +377,7 @@ async def scrape_with_httpx(url: str, wait_seconds: int = 2, extract_type: str =
     )
 
     description = _extract_meta_content(
-        soup,
+        parser,
         [
             {"name": "description"},
             {"property": "og:description"},
@@ -384,9 +385,9 @@ async def scrape_with_httpx(url: str, wait_seconds: int = 2, extract_type: str =
         ],
     )
 
-    tags = _extract_tags(soup)
-    tables = _extract_tables(soup)
-    lists = _extract_lists(soup)
+    tags = _extract_tags(parser)
+    tables = _extract_tables(parser)
+    lists = _extract_lists(parser)
 
     return {
         "content": extracted or "",
@@ -398,7 +399,154 @@ async def scrape_with_httpx(url: str, wait_seconds: int = 2, extract_type: str =
         "tables": tables,
         "lists": lists,
         "word_count": len(extracted.split()) if extracted else 0,
+        "extraction_method": extraction_method,
+        "js_signals": js_signals,
+    }
+
+
+async def scrape_with_httpx(url: str, wait_seconds: int = 2, extract_type: str = "auto") -> Dict[str, Any]:
+    """
+    Scrape a URL using httpx (no browser automation).
+    
+    Args:
+        url: URL to scrape
+        wait_seconds: Kept for compatibility; influences timeout/retry pacing
+        extract_type: 'auto', 'article', 'text', or 'structured'
+        
+    Returns:
+        Dictionary with scraped content
+    """
+    logger.info(f"Scraping with httpx: {url}")
+    
+    headers = {
+        # Consistent User-Agent / Accept-Language / client-hint set
+        **pick_profile().http_headers(),
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Connection': 'keep-alive',
+    }
+
+    # Revalidate a previously cached extraction instead of re-downloading.
+    cache = get_response_cache()
+    cached = await asyncio.to_thread(cache.get, url, extract_type) if cache else None
+    if cached:
+        headers.update(cached.conditional_headers())
+    
+    timeout_seconds = min(60.0, max(20.0, 20.0 + float(wait_seconds)))
+    retries = 3
+    response: httpx.Response | None = None
+    body: DownloadedBody | None = None
+
+    client = get_http_client()
+    limiter = get_rate_limiter()
+
+    for attempt in range(1, retries + 1):
+        try:
+            # Pace against every other in-flight request to this host.
+            await limiter.acquire(url)
+            async with host_slot(url):
+                # Stream the body so binary or oversized responses are
+                # dropped early instead of being buffered whole.
+                async with client.stream("GET", url, headers=headers, timeout=timeout_seconds) as response:
+                    limiter.record(url, response.status_code, response.headers.get("Retry-After"))
+                    if response.is_success:
+                        body = await read_text_body(response)
+
+            if response.status_code == 304 and cached:
+                break
+
+            # Retry transient upstream failures.
+            if response.status_code in {429, 500, 502, 503, 504}:
+                if attempt < retries:
+                    if response.status_code in THROTTLE_STATUSES:
+                        # The limiter already paused the host (Retry-After
+                        # or backoff); the next acquire() waits it out.
+                        delay = 0
+                    else:
+                        delay = attempt * max(1, wait_seconds)
+                    logger.warning(
+                        "Transient status %s for %s (attempt %s/%s). Retrying in %ss.",
+                        response.status_code,
+                        url,
+                        attempt,
+                        retries,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                raise ScrapeRequestError(
+                    status_code=response.status_code,
+                    detail=f"Target site returned {response.status_code}. Please retry later.",
+                )
+
+            if response.status_code == 403:
+                raise ScrapeRequestError(
+                    status_code=403,
+                    detail="Access blocked by target site (HTTP 403).",
+                )
+
+            response.raise_for_status()
+            break
+
+        except ScrapeRequestError:
+            raise
+        except DownloadRejected as exc:
+            raise ScrapeRequestError(status_code=exc.status_code, detail=exc.detail) from exc
+        except httpx.TimeoutException as exc:
+            if attempt < retries:
+                delay = attempt * max(1, wait_seconds)
+                logger.warning("Timeout scraping %s (attempt %s/%s). Retrying in %ss.", url, attempt, retries, delay)
+                await asyncio.sleep(delay)
+                continue
+            raise ScrapeRequestError(status_code=504, detail=f"Request timed out: {exc}") from exc
+        except httpx.TransportError as exc:
+            if attempt < retries:
+                delay = attempt * max(1, wait_seconds)
+                logger.warning("Transport error scraping %s (attempt %s/%s). Retrying in %ss.", url, attempt, retries, delay)
+                await asyncio.sleep(delay)
+                continue
+            raise ScrapeRequestError(status_code=502, detail=f"Transport error: {exc}") from exc
+
+    if response is None:
+        raise ScrapeRequestError(status_code=500, detail="Unknown error: no response received")
+
+    if response.status_code == 304 and cached:
+        logger.info("Not modified, serving cached extraction for %s", url)
+        await asyncio.to_thread(cache.touch, url, extract_type)
+        return {**cached.result, "http_status": 304}
+
+    html = body.text if body else ""
+    if not html.strip():
+        raise ScrapeRequestError(status_code=502, detail="Target site returned an empty response")
+
+    logger.info("Got %s bytes from %s", body.size, response.url)
+
+    # Identical payloads (mirrors, tracking-parameter variants) reuse one extraction.
+    memo = get_extraction_cache()
+    memo_key = content_key(body.digest, response.encoding, extract_type) if memo else None
+    extracted_data = memo.get(memo_key) if memo else None
+
+    if extracted_data is None:
+        try:
+            extracted_data = await run_extraction(_extract_page, html, str(response.url), extract_type)
+        except ExtractionPoolSaturated as exc:
+            raise ScrapeRequestError(status_code=503, detail=f"Extraction workers are busy: {exc}") from exc
+        except ExtractionWorkerCrashed as exc:
+            raise ScrapeRequestError(status_code=503, detail=f"Extraction failed: {exc}") from exc
+        if memo:
+            memo.put(memo_key, extracted_data)
+    else:
+        logger.info("Reusing extraction of identical content for %s", url)
+
+    result = {
+        **extracted_data,
         "final_url": str(response.url),
         "http_status": response.status_code,
-        "extraction_method": extraction_method,
     }
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if cache and (etag or last_modified):
+        await asyncio.to_thread(cache.put, url, extract_type, etag, last_modified, result)
+
+    return result
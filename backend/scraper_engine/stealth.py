@@ -55,6 +55,10 @@ async def setup_stealth_page(page: Page) -> Page:
     return page
 
 
+# Loaded once; UserAgent() reads and parses its data file on construction.
+_user_agents: UserAgent = None
+
+
 def get_random_user_agent() -> str:
     """
     Get a random realistic user agent string.
@@ -62,5 +66,8 @@ def get_random_user_agent() -> str:
     Returns:
         str: Random user agent
     """
-    ua = UserAgent()
-    return ua.random
+    global _user_agents
+
+    if _user_agents is None:
+        _user_agents = UserAgent()
+    return _user_agents.random
@@ -0,0 +1,161 @@
+"""
+Spider Job Queue
+
+Crawl requests become jobs with IDs that run on a small worker pool,
+so triggering a crawl returns immediately instead of holding the HTTP
+request open for the whole crawl. A trigger for a spider that is
+already queued or running is coalesced into the existing job rather
+than starting a duplicate crawl.
+
+Jobs live in memory; the most recent SPIDER_JOB_HISTORY are kept for
+status lookups.
+"""
+
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from scheduler import run_spiders
+
+logger = logging.getLogger(__name__)
+
+# Crawl runs executing at once (each run starts its own worker process)
+SPIDER_JOB_WORKERS = int(os.getenv("SPIDER_JOB_WORKERS", "2"))
+SPIDER_JOB_HISTORY = int(os.getenv("SPIDER_JOB_HISTORY", "100"))
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+@dataclass
+class SpiderJob:
+    """One queued crawl of a set of spiders."""
+    id: str
+    spiders: List[str]
+    trigger: str
+    status: str = "queued"
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class Submission:
+    """Outcome of a crawl trigger."""
+    job: Optional[SpiderJob]
+    # spider -> ID of the already active job it was merged into
+    coalesced: Dict[str, str]
+
+
+_lock = threading.Lock()
+_jobs: "OrderedDict[str, SpiderJob]" = OrderedDict()
+_executor: ThreadPoolExecutor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=SPIDER_JOB_WORKERS, thread_name_prefix="spider-job")
+    return _executor
+
+
+def _run_job(job: SpiderJob):
+    with _lock:
+        job.status = "running"
+        job.started_at = datetime.now().isoformat()
+
+    try:
+        results = run_spiders(job.spiders)
+        status = "finished" if all(r["status"] == "finished" for r in results.values()) else "failed"
+        error = None
+    except Exception as e:
+        logger.error(f"Spider job {job.id} failed: {e}", exc_info=True)
+        results, status, error = {}, "failed", str(e)
+
+    with _lock:
+        job.results = results
+        job.status = status
+        job.error = error
+        job.finished_at = datetime.now().isoformat()
+    logger.info("Spider job %s %s (%s)", job.id, status, ", ".join(job.spiders))
+
+
+def submit_spider_job(spiders: List[str], trigger: str = "manual") -> Submission:
+    """
+    Queue a crawl, coalescing spiders that are already queued or running.
+
+    Args:
+        spiders: Spider names to crawl
+        trigger: Who asked for the crawl, e.g. 'manual' or 'schedule'
+
+    Returns:
+        Submission with the new job (None if every spider was coalesced)
+        and the spiders merged into active jobs
+    """
+    with _lock:
+        active = {
+            spider: job.id
+            for job in _jobs.values()
+            if job.status in ACTIVE_STATUSES
+            for spider in job.spiders
+        }
+        requested = list(dict.fromkeys(spiders))
+        coalesced = {spider: active[spider] for spider in requested if spider in active}
+        remaining = [spider for spider in requested if spider not in active]
+
+        job = None
+        if remaining:
+            job = SpiderJob(id=uuid.uuid4().hex, spiders=remaining, trigger=trigger)
+            _jobs[job.id] = job
+            _trim_history()
+
+    if coalesced:
+        logger.info("Coalesced spider trigger into running jobs: %s", coalesced)
+    if job:
+        _get_executor().submit(_run_job, job)
+    return Submission(job=job, coalesced=coalesced)
+
+
+def _trim_history():
+    """Forget the oldest finished jobs beyond SPIDER_JOB_HISTORY (caller holds _lock)."""
+    excess = len(_jobs) - SPIDER_JOB_HISTORY
+    for job_id in [job_id for job_id, job in _jobs.items() if job.status not in ACTIVE_STATUSES][:max(0, excess)]:
+        del _jobs[job_id]
+
+
+def get_spider_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Snapshot of a job, or None if unknown."""
+    with _lock:
+        job = _jobs.get(job_id)
+        return job.to_dict() if job else None
+
+
+def list_spider_jobs() -> List[Dict[str, Any]]:
+    """Snapshots of all known jobs, newest first."""
+    with _lock:
+        return [job.to_dict() for job in reversed(_jobs.values())]
+
+
+def shutdown_spider_jobs():
+    """Stop accepting work and drop queued jobs; running crawls are abandoned."""
+    global _executor
+
+    if _executor:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+    with _lock:
+        for job in _jobs.values():
+            if job.status == "queued":
+                job.status = "cancelled"
@@ -0,0 +1,153 @@
+"""
+In-process Spider Runner
+
+Runs several Scrapy spiders concurrently in one Twisted reactor with
+the project's shared settings, instead of one `scrapy crawl`
+subprocess after another. Total time is roughly that of the slowest
+spider, and Python/Scrapy start up once per run.
+
+The reactor cannot be restarted within a process, so every run happens
+in a fresh worker process (spawned, so the API's threads are never
+forked). Per-spider status and Scrapy stats are sent back to the caller.
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Seconds a whole run may take before the caller stops waiting (0 = no limit)
+SPIDER_RUN_TIMEOUT_SECONDS = float(os.getenv("SPIDER_RUN_TIMEOUT_SECONDS", "0"))
+
+SpiderResult = Dict[str, Any]
+
+
+def _plain_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Make Scrapy stats JSON-friendly."""
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in stats.items()
+    }
+
+
+def _crawl_in_process(spiders: List[str], project_path: str) -> Dict[str, SpiderResult]:
+    """Worker process entry point: crawl all spiders in one reactor."""
+    os.chdir(project_path)
+    if project_path not in sys.path:
+        sys.path.insert(0, project_path)
+
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+
+    process = CrawlerProcess(get_project_settings())
+    results: Dict[str, SpiderResult] = {}
+    crawlers = {}
+
+    for name in spiders:
+        try:
+            crawler = process.create_crawler(name)
+        except KeyError:
+            results[name] = {"status": "error", "error": f"Spider not found: {name}", "stats": {}}
+            continue
+        crawlers[name] = crawler
+        deferred = process.crawl(crawler)
+        deferred.addErrback(
+            lambda failure, name=name: results.__setitem__(
+                name, {"status": "error", "error": failure.getErrorMessage()}
+            )
+        )
+
+    if crawlers:
+        # Blocks until every spider has finished.
+        process.start()
+
+    for name, crawler in crawlers.items():
+        stats = _plain_stats(crawler.stats.get_stats()) if crawler.stats else {}
+        result = results.setdefault(name, {})
+        result["stats"] = stats
+        result["errors"] = stats.get("log_count/ERROR", 0)
+        if "status" not in result:
+            finish_reason = stats.get("finish_reason")
+            result["status"] = "finished" if finish_reason == "finished" else "failed"
+            if finish_reason != "finished":
+                result["error"] = f"Spider closed with reason: {finish_reason}"
+
+    return {name: results[name] for name in spiders if name in results}
+
+
+def _worker_main(spiders: List[str], project_path: str, results_queue):
+    try:
+        results_queue.put(("ok", _crawl_in_process(spiders, project_path)))
+    except BaseException as e:
+        results_queue.put(("error", f"{type(e).__name__}: {e}"))
+
+
+def crawl_spiders(spiders: List[str], project_path: str) -> Dict[str, SpiderResult]:
+    """
+    Run spiders in parallel in a dedicated worker process.
+
+    Args:
+        spiders: Spider names; duplicates are run once
+        project_path: Directory holding scrapy.cfg
+
+    Returns:
+        Per-spider results: {"status": "finished" | "failed" | "error",
+        "error": optional message, "errors": logged error count,
+        "stats": Scrapy stats}
+
+    Raises:
+        RuntimeError: The worker process crashed or failed to start the run
+        TimeoutError: The run exceeded SPIDER_RUN_TIMEOUT_SECONDS
+    """
+    unique = list(dict.fromkeys(spiders))
+    if not unique:
+        return {}
+
+    ctx = multiprocessing.get_context("spawn")
+    results_queue = ctx.Queue()
+    worker = ctx.Process(
+        target=_worker_main,
+        args=(unique, project_path, results_queue),
+        name="spider-runner",
+        daemon=True,
+    )
+    worker.start()
+    deadline = time.monotonic() + SPIDER_RUN_TIMEOUT_SECONDS if SPIDER_RUN_TIMEOUT_SECONDS > 0 else None
+
+    try:
+        while True:
+            try:
+                outcome, payload = results_queue.get(timeout=1)
+                break
+            except queue.Empty:
+                if not worker.is_alive():
+                    raise RuntimeError(f"Spider worker exited with code {worker.exitcode}")
+                if deadline is not None and time.monotonic() > deadline:
+                    raise TimeoutError(f"Spider run exceeded {SPIDER_RUN_TIMEOUT_SECONDS:g}s")
+    finally:
+        if worker.is_alive():
+            worker.join(timeout=5)
+        if worker.is_alive():
+            worker.terminate()
+            worker.join()
+
+    if outcome != "ok":
+        raise RuntimeError(f"Spider run failed: {payload}")
+
+    for name, result in payload.items():
+        stats = result.get("stats", {})
+        logger.info(
+            "Spider %s %s (items=%s, errors=%s, elapsed=%ss)",
+            name,
+            result["status"],
+            stats.get("item_scraped_count", 0),
+            result.get("errors", 0),
+            stats.get("elapsed_time_seconds"),
+        )
+    return payload
@@ -0,0 +1,17 @@
+from scrapy.extensions.httpcache import RFC2616Policy
+
+
+class RevalidatingPolicy(RFC2616Policy):
+    """
+    RFC2616Policy that never serves a cached page without asking the server.
+
+    RFC2616Policy treats pages with Last-Modified but no Cache-Control as
+    fresh for a heuristic 10% of their age, so a listing page could be
+    replayed from cache and new items missed. Here every cached page is
+    revalidated with If-None-Match / If-Modified-Since; a 304 still reuses
+    the stored body.
+    """
+
+    def is_cached_response_fresh(self, cachedresponse, request):
+        self._set_conditional_validators(request, cachedresponse)
+        return False
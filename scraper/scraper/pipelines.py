@@ -1,59 +1,345 @@
 import os
 import json
+import hashlib
 import psycopg2
-from psycopg2.extras import Json
+from psycopg2.extras import Json, execute_values
+from scrapy.exceptions import NotConfigured
+from twisted.internet import task
 from dotenv import load_dotenv
 
+from .seen_filter import AlreadySeen, BloomFilter
+
 load_dotenv()
 
 
+def default_summary(item):
+    """Summary the SummarizerPipeline stores for an item."""
+    if item.get("summary"):
+        return item["summary"]
+    title = item.get("title", "")
+    source = item.get("source", "")
+    return f"{source}: {title}" if title else None
+
+
+def connect():
+    """Open a psycopg2 connection from the PG_* environment."""
+    return psycopg2.connect(
+        dbname=os.getenv("PG_DB", "scraper_db"),
+        user=os.getenv("PG_USER", "postgres"),
+        password=os.getenv("PG_PASSWORD", "yourpassword"),
+        host=os.getenv("PG_HOST", "localhost"),
+        port=os.getenv("PG_PORT", "5432"),
+    )
+
+
 class SummarizerPipeline:
     """Pipeline to generate summaries for items."""
     
     def process_item(self, item, spider):
         # Generate a basic summary from title if summary is not present
-        if not item.get("summary"):
-            title = item.get("title", "")
-            source = item.get("source", "")
-            if title:
-                item["summary"] = f"{source}: {title}"
+        summary = default_summary(item)
+        if summary:
+            item["summary"] = summary
         return item
 
 
+# Rows buffered before a flush, and the longest a row waits in the buffer
+PG_BATCH_SIZE = int(os.getenv("PG_BATCH_SIZE", "500"))
+PG_FLUSH_INTERVAL_SECONDS = float(os.getenv("PG_FLUSH_INTERVAL_SECONDS", "5"))
+# "upsert" rewrites rows whose content changed; "insert" keeps the first version
+PG_WRITE_MODE = os.getenv("PG_WRITE_MODE", "upsert").lower()
+
+ROW_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s, now())"
+
+INSERT_SQL = """
+    INSERT INTO scraped_items (source, title, url, summary, tags, published_at, content_hash, last_seen_at)
+    VALUES %s
+    ON CONFLICT (url) DO NOTHING
+    RETURNING url, true
+"""
+
+# Only rows whose fingerprint differs are rewritten; xmax = 0 marks a fresh insert.
+UPSERT_SQL = """
+    INSERT INTO scraped_items (source, title, url, summary, tags, published_at, content_hash, last_seen_at)
+    VALUES %s
+    ON CONFLICT (url) DO UPDATE SET
+        source = EXCLUDED.source,
+        title = EXCLUDED.title,
+        summary = EXCLUDED.summary,
+        tags = EXCLUDED.tags,
+        published_at = EXCLUDED.published_at,
+        content_hash = EXCLUDED.content_hash,
+        last_seen_at = EXCLUDED.last_seen_at
+    WHERE scraped_items.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+    RETURNING url, (xmax = 0)
+"""
+
+TOUCH_SQL = "UPDATE scraped_items SET last_seen_at = now() WHERE url = ANY(%s)"
+
+URL_COLUMN = 2
+
+
+def content_fingerprint(item):
+    """Hash of the stored fields, used to skip rewriting unchanged rows."""
+    payload = json.dumps(
+        [
+            item.get("source"),
+            item.get("title"),
+            item.get("summary"),
+            item.get("tags") or [],
+            str(item.get("published_at") or ""),
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
 class PostgresPipeline:
+    """
+    Buffer items and write them in batches with one multi-row INSERT
+    (psycopg2 execute_values) and one commit per batch.
+
+    In upsert mode each row carries a content fingerprint, and an existing
+    row is only rewritten when its fingerprint changed; rows seen again
+    unchanged just get last_seen_at bumped in one bulk UPDATE. Inserted,
+    updated and unchanged counts are kept in the crawl stats.
+
+    A batch is flushed when it reaches PG_BATCH_SIZE rows, when
+    PG_FLUSH_INTERVAL_SECONDS pass, and when the spider closes. If a
+    batch fails, it is split in halves and retried so only the offending
+    rows are dropped (and logged); rows psycopg2 cannot adapt are dropped
+    the same way. A lost connection is reopened and the batch retried.
+    """
+
     def open_spider(self, spider):
-        self.conn = psycopg2.connect(
-            dbname=os.getenv("PG_DB", "scraper_db"),
-            user=os.getenv("PG_USER", "postgres"),
-            password=os.getenv("PG_PASSWORD", "yourpassword"),
-            host=os.getenv("PG_HOST", "localhost"),
-            port=os.getenv("PG_PORT", "5432"),
-        )
+        self.conn = connect()
         self.cur = self.conn.cursor()
+        self.write_sql = UPSERT_SQL if PG_WRITE_MODE == "upsert" else INSERT_SQL
+        self.buffer = {}
+        self.counts = {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0}
+        self.stats = spider.crawler.stats if getattr(spider, "crawler", None) else None
+
+        self.flush_loop = task.LoopingCall(self.flush, spider)
+        self._start_flush_loop(spider)
+
+    def _start_flush_loop(self, spider):
+        deferred = self.flush_loop.start(PG_FLUSH_INTERVAL_SECONDS, now=False)
+        deferred.addErrback(self._flush_loop_failed, spider)
+
+    def _flush_loop_failed(self, failure, spider):
+        # LoopingCall stops on the first exception; keep flushing on schedule.
+        spider.logger.error(f"Scheduled flush failed, restarting the flush loop: {failure.getErrorMessage()}")
+        self._inc_stat("postgres/flush_errors")
+        self._start_flush_loop(spider)
 
     def close_spider(self, spider):
-        self.cur.close()
-        self.conn.close()
+        if self.flush_loop.running:
+            self.flush_loop.stop()
+        try:
+            self.flush(spider)
+        finally:
+            self.cur.close()
+            self.conn.close()
+        spider.logger.info(
+            "Postgres: {inserted} inserted, {updated} updated, "
+            "{unchanged} unchanged, {failed} failed".format(**self.counts)
+        )
 
     def process_item(self, item, spider):
+        # Keyed by URL: a batch may not touch the same row twice in one upsert.
+        self.buffer[item.get("url")] = (
+            item.get("source"),
+            item.get("title"),
+            item.get("url"),
+            item.get("summary"),
+            Json(item.get("tags") or []),  # ✅ proper JSON
+            item.get("published_at"),
+            content_fingerprint(item),
+        )
+        if len(self.buffer) >= PG_BATCH_SIZE:
+            self.flush(spider)
+        return item
+
+    def flush(self, spider):
+        """Write all buffered rows."""
+        if not self.buffer:
+            return
+        rows, self.buffer = list(self.buffer.values()), {}
+        try:
+            counts = self._write(rows, spider)
+        except psycopg2.Error:
+            # Could not reconnect: keep the rows for the next flush, newer
+            # versions of a URL first.
+            self.buffer = {**{row[URL_COLUMN]: row for row in rows}, **self.buffer}
+            raise
+        self._inc_stat("postgres/flushes")
+        for key, count in counts.items():
+            self.counts[key] += count
+            self._inc_stat(f"postgres/rows_{key}", count)
+        spider.logger.debug(f"Flushed {len(rows)} rows: {counts}")
+
+    def _write(self, rows, spider, retry=True):
+        """Write rows in one transaction; on error bisect to isolate bad rows.
+
+        Args:
+            rows: Row tuples in ROW_TEMPLATE order
+            spider: Spider, for logging
+            retry: Retry the same rows once if the connection was lost
+
+        Returns:
+            Counts of inserted, updated, unchanged and failed rows
+
+        Raises:
+            psycopg2.OperationalError: The connection was lost and could
+                not be reopened
+        """
         try:
-            self.cur.execute(
-                """
-                INSERT INTO scraped_items (source, title, url, summary, tags, published_at)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                ON CONFLICT (url) DO NOTHING;
-                """,
-                (
-                    item.get("source"),
-                    item.get("title"),
-                    item.get("url"),
-                    item.get("summary"),
-                    Json(item.get("tags") or []),  # ✅ proper JSON
-                    item.get("published_at"),
-                ),
+            written = execute_values(
+                self.cur, self.write_sql, rows, template=ROW_TEMPLATE, page_size=len(rows), fetch=True
             )
+            written_urls = {url for url, _ in written}
+            unchanged = [row[URL_COLUMN] for row in rows if row[URL_COLUMN] not in written_urls]
+            if unchanged:
+                self.cur.execute(TOUCH_SQL, (unchanged,))
             self.conn.commit()
-        except Exception:
+        except (TypeError, ValueError, psycopg2.Error) as e:
+            # TypeError/ValueError: a value psycopg2 cannot adapt.
+            if not self._rollback(spider) and retry:
+                # The connection went away; the rows are not to blame.
+                return self._write(rows, spider, retry=False)
+            if len(rows) == 1:
+                spider.logger.error(f"Dropping item {rows[0][URL_COLUMN]}: {e}")
+                return {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 1}
+            middle = len(rows) // 2
+            first = self._write(rows[:middle], spider)
+            second = self._write(rows[middle:], spider)
+            return {key: first[key] + second[key] for key in first}
+
+        inserted = sum(1 for _, is_insert in written if is_insert)
+        return {
+            "inserted": inserted,
+            "updated": len(written) - inserted,
+            "unchanged": len(unchanged),
+            "failed": 0,
+        }
+
+    def _rollback(self, spider):
+        """Roll back the failed transaction, reconnecting if the connection is gone.
+
+        Returns:
+            True if the connection survived, False if it was reopened
+        """
+        if not self.conn.closed:
+            try:
+                self.conn.rollback()
+                return True
+            except psycopg2.Error as e:
+                spider.logger.warning(f"Rollback failed: {e}")
+        spider.logger.warning("Postgres connection lost, reconnecting")
+        try:
+            self.conn.close()
+        except psycopg2.Error:
+            pass
+        self.conn = connect()
+        self.cur = self.conn.cursor()
+        self._inc_stat("postgres/reconnects")
+        return False
+
+    def _inc_stat(self, key, count=1):
+        if self.stats is not None and count:
+            self.stats.inc_value(key, count)
+
+
+# Seen-set that drops already stored items before any other pipeline work
+SEEN_FILTER_ENABLED = os.getenv("SEEN_FILTER_ENABLED", "true").lower() == "true"
+SEEN_FILTER_FP_RATE = float(os.getenv("SEEN_FILTER_FP_RATE", "0.001"))
+# Sized for the stored row count plus this headroom, but never above SEEN_FILTER_MAX_MB
+SEEN_FILTER_HEADROOM = float(os.getenv("SEEN_FILTER_HEADROOM", "1.5"))
+SEEN_FILTER_MIN_CAPACITY = int(os.getenv("SEEN_FILTER_MIN_CAPACITY", "100000"))
+SEEN_FILTER_MAX_MB = float(os.getenv("SEEN_FILTER_MAX_MB", "64"))
+
+SEEN_KEYS_SQL = {
+    # Upsert mode keys on URL + fingerprint so changed items still get through.
+    "upsert": "SELECT url, content_hash FROM scraped_items WHERE content_hash IS NOT NULL",
+    "insert": "SELECT url, NULL FROM scraped_items",
+}
+
+
+def seen_key(url, fingerprint=None):
+    return f"{url}\0{fingerprint}" if fingerprint else url
+
+
+class SeenFilterPipeline:
+    """
+    Drop items that are already stored before they reach the other
+    pipelines or the database.
+
+    At open_spider the stored keys are streamed into a Bloom filter
+    (see seen_filter). Keys are the URL in insert mode, and URL plus
+    content fingerprint in upsert mode, so only new or changed items pass.
+    The URLs of dropped items get last_seen_at bumped in bulk at close.
+    """
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not SEEN_FILTER_ENABLED:
+            raise NotConfigured("SEEN_FILTER_ENABLED is false")
+        return cls()
+
+    def open_spider(self, spider):
+        self.conn = connect()
+        self.mode = "upsert" if PG_WRITE_MODE == "upsert" else "insert"
+        self.dropped_urls = []
+        self.stats = spider.crawler.stats if getattr(spider, "crawler", None) else None
+
+        with self.conn.cursor() as cur:
+            # Planner estimate; avoids a count(*) scan just to size the filter.
+            cur.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = 'scraped_items'::regclass")
+            estimate = max(0, cur.fetchone()[0])
+        self.seen = BloomFilter(
+            capacity=max(SEEN_FILTER_MIN_CAPACITY, estimate * SEEN_FILTER_HEADROOM),
+            fp_rate=SEEN_FILTER_FP_RATE,
+            max_bytes=SEEN_FILTER_MAX_MB * 1024 * 1024,
+        )
+
+        # Server-side cursor: keys stream in without materialising the table.
+        with self.conn.cursor(name="seen_keys") as cur:
+            cur.itersize = 10000
+            cur.execute(SEEN_KEYS_SQL[self.mode])
+            for url, fingerprint in cur:
+                self.seen.add(seen_key(url, fingerprint))
+        self.conn.commit()
+
+        spider.logger.info(
+            f"Seen filter loaded {len(self.seen)} keys into {self.seen.nbytes / 1024:.0f} KiB "
+            f"(~{self.seen.estimated_fp_rate():.4%} false positives)"
+        )
+
+    def close_spider(self, spider):
+        try:
+            with self.conn.cursor() as cur:
+                for start in range(0, len(self.dropped_urls), PG_BATCH_SIZE):
+                    cur.execute(TOUCH_SQL, (self.dropped_urls[start:start + PG_BATCH_SIZE],))
+            self.conn.commit()
+        except psycopg2.Error as e:
             self.conn.rollback()
-            raise
-        return item
\ No newline at end of file
+            spider.logger.error(f"Could not update last_seen_at for skipped items: {e}")
+        finally:
+            self.conn.close()
+
+    def process_item(self, item, spider):
+        url = item.get("url")
+        fingerprint = None
+        if self.mode == "upsert":
+            fingerprint = content_fingerprint({**item, "summary": default_summary(item)})
+        key = seen_key(url, fingerprint)
+
+        if key in self.seen:
+            self.dropped_urls.append(url)
+            if self.stats is not None:
+                self.stats.inc_value("seen_filter/dropped")
+            raise AlreadySeen(f"Already stored: {url}")
+        # Also catches repeats within this crawl.
+        self.seen.add(key)
+        return item
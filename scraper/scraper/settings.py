@@ -11,8 +11,25 @@ NEWSPIDER_MODULE = "scraper.spiders"
 ROBOTSTXT_OBEY = True
 
 ITEM_PIPELINES = {
+    "scraper.pipelines.SeenFilterPipeline": 100,
     "scraper.pipelines.SummarizerPipeline": 200,
     "scraper.pipelines.PostgresPipeline": 300,
 }
 
+# Skipped already-stored items are logged at DEBUG instead of WARNING
+LOG_FORMATTER = "scraper.seen_filter.SeenFilterLogFormatter"
+
+# Revalidate every cached page with If-None-Match / If-Modified-Since on
+# repeat crawls and reuse the stored response on 304 Not Modified. Pages
+# are never served from cache on heuristic freshness alone.
+HTTPCACHE_ENABLED = os.getenv("SCRAPY_HTTPCACHE_ENABLED", "true").lower() == "true"
+HTTPCACHE_POLICY = "scraper.httpcache.RevalidatingPolicy"
+# Store pages without expiry hints too; they are revalidated before reuse anyway
+HTTPCACHE_ALWAYS_STORE = True
+HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
+HTTPCACHE_DIR = os.getenv("SCRAPY_HTTPCACHE_DIR", "httpcache")
+# Drop entries not refreshed within this many seconds (0 = never)
+HTTPCACHE_EXPIRATION_SECS = int(os.getenv("SCRAPY_HTTPCACHE_EXPIRATION_SECS", str(7 * 24 * 3600)))
+HTTPCACHE_IGNORE_HTTP_CODES = [429, 500, 502, 503, 504]
+
 LOG_LEVEL = "INFO"
\ No newline at end of file